@@ -3,6 +3,7 @@
 Test the current Rust downscaler and compare with expected output
 """
 from PIL import Image
+import numpy as np
 import subprocess
 import os
 
@@ -11,48 +12,55 @@ INPUT = 'chair-1.png'
 EXPECTED = 'downscaled-chair-1.png'
 RUST_OUTPUT = 'rust-output.png'
 
-# Run Rust downscaler
-print("Running Rust downscaler...")
-result = subprocess.run([
+
+def load_alpha(path):
+    """Decode an image once and return its alpha channel as a (height, width) array."""
+    with Image.open(path) as im:
+        return np.asarray(im.convert("RGBA"))[..., 3]
+
+
+def bounds_from_alpha(alpha):
+    """Content bounds (min_x, min_y, max_x + 1, max_y + 1) of the non-transparent pixels."""
+    nz = alpha > 0  # Has alpha
+    height, width = nz.shape
+
+    rows = np.any(nz, axis=1)
+    cols = np.any(nz, axis=0)
+    if not rows.any():
+        # Fully transparent: same result as the old per-pixel scan
+        return (width, height, 1, 1)
+
+    min_y = int(np.argmax(rows))
+    max_y = height - 1 - int(np.argmax(rows[::-1]))
+    min_x = int(np.argmax(cols))
+    max_x = width - 1 - int(np.argmax(cols[::-1]))
+
+    return (min_x, min_y, max_x + 1, max_y + 1)
+
+
+# Run Rust downscaler; its stdout/stderr go straight to the console
+print("Running Rust downscaler...", flush=True)
+proc = subprocess.Popen([
     'src-tauri/target/release/pixels-toolkit.exe',  # Or whatever the binary name is
     'downscale',
     '--input', INPUT,
     '--output', RUST_OUTPUT
-], capture_output=True, text=True)
+])
 
-print(result.stdout)
-if result.stderr:
-    print("STDERR:", result.stderr)
+# Decode the expected image while the downscaler runs
+expected_alpha = load_alpha(EXPECTED)
+expected_bounds = bounds_from_alpha(expected_alpha)
+proc.wait()
 
 # Compare outputs if rust output exists
 if os.path.exists(RUST_OUTPUT):
-    rust_img = Image.open(RUST_OUTPUT)
-    expected_img = Image.open(EXPECTED)
-
     print("\n=== Comparison ===")
-    print(f"Rust output canvas: {rust_img.size}")
-    print(f"Expected canvas: {expected_img.size}")
-
-    # Get content bounds
-    def get_bounds(img):
-        pixels = img.load()
-        width, height = img.size
-
-        min_x, min_y = width, height
-        max_x, max_y = 0, 0
-
-        for y in range(height):
-            for x in range(width):
-                if pixels[x, y][3] > 0:  # Has alpha
-                    min_x = min(min_x, x)
-                    max_x = max(max_x, x)
-                    min_y = min(min_y, y)
-                    max_y = max(max_y, y)
 
-        return (min_x, min_y, max_x + 1, max_y + 1)
+    rust_alpha = load_alpha(RUST_OUTPUT)
+    print(f"Rust output canvas: {rust_alpha.shape[::-1]}")
+    print(f"Expected canvas: {expected_alpha.shape[::-1]}")
 
-    rust_bounds = get_bounds(rust_img)
-    expected_bounds = get_bounds(expected_img)
+    rust_bounds = bounds_from_alpha(rust_alpha)
 
     rust_size = (rust_bounds[2] - rust_bounds[0], rust_bounds[3] - rust_bounds[1])
     expected_size = (expected_bounds[2] - expected_bounds[0], expected_bounds[3] - expected_bounds[1])
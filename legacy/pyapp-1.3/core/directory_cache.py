@@ -0,0 +1,50 @@
+"""
+Cached directory listings, invalidated when a folder changes on disk.
+"""
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class DirectoryListingCache:
+    """Sorted listings of files with given extensions, keyed by resolved folder path.
+
+    Entries are dropped by invalidate() (e.g. from a QFileSystemWatcher) and
+    also remember the folder's mtime, so a change that was never reported
+    still triggers a rescan.
+    """
+
+    def __init__(self, extensions: Iterable[str]):
+        self.extensions = frozenset(ext.lower() for ext in extensions)
+        self._entries: Dict[str, Tuple[int, List[str]]] = {}
+
+    def list_files(self, folder: Path) -> List[str]:
+        """Names of matching files in folder, sorted case-insensitively.
+
+        Raises FileNotFoundError if the folder doesn't exist.
+        """
+        key = str(Path(folder).resolve())
+        mtime_ns = os.stat(key).st_mtime_ns
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # Get all matching files in a single directory pass
+        extensions = self.extensions
+        with os.scandir(key) as it:
+            names = [
+                e.name for e in it
+                if e.is_file() and os.path.splitext(e.name)[1].lower() in extensions
+            ]
+
+        # Sort by name
+        names.sort(key=str.lower)
+        self._entries[key] = (mtime_ns, names)
+        return names
+
+    def invalidate(self, folder: Optional[Path] = None):
+        """Forget the listing for folder, or every listing if folder is None."""
+        if folder is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(str(Path(folder).resolve()), None)
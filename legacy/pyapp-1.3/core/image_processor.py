@@ -1,18 +1,41 @@
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 from PIL import Image
 import math
+import numpy as np
+from scipy.ndimage import binary_erosion, generate_binary_structure
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessSettings:
+    """Immutable post-process options, cheap to pickle for worker processes."""
+    alpha_low_cutoff: int
+    alpha_high_min: int
+    alpha_high_max: int
+    enable_color_simplify: bool
+    lab_merge_threshold: float
+    outline_color: Tuple[int, int, int, int]
+    edge_cutoff: int
+    connectivity: int
+    thickness: int
+    prefix_to_strip: str = ""
+    use_filename_transform: bool = False
+    filename_prefix: str = ""
+    filename_suffix: str = ""
+
+
+# CIE LAB reference white (D65)
+_XN, _YN, _ZN = 0.95047, 1.00000, 1.08883
 
 
 def rgb_to_lab(r, g, b):
     """Convert RGB to LAB color space."""
-    # sRGB to linear RGB
-    def srgb_to_linear(c):
-        c = c / 255.0
-        return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
-    
-    rl = srgb_to_linear(r)
-    gl = srgb_to_linear(g)
-    bl = srgb_to_linear(b)
+    # sRGB to linear RGB (helpers inlined to avoid per-call closures)
+    r, g, b = r / 255.0, g / 255.0, b / 255.0
+    rl = r / 12.92 if r <= 0.04045 else ((r + 0.055) / 1.055) ** 2.4
+    gl = g / 12.92 if g <= 0.04045 else ((g + 0.055) / 1.055) ** 2.4
+    bl = b / 12.92 if b <= 0.04045 else ((b + 0.055) / 1.055) ** 2.4
     
     # Linear RGB to XYZ
     X = rl * 0.4124564 + gl * 0.3575761 + bl * 0.1804375
@@ -20,13 +43,11 @@ def rgb_to_lab(r, g, b):
     Z = rl * 0.0193339 + gl * 0.1191920 + bl * 0.9503041
     
     # XYZ to LAB
-    Xn, Yn, Zn = 0.95047, 1.00000, 1.08883
-    xr, yr, zr = X / Xn, Y / Yn, Z / Zn
-    
-    def f(t):
-        return t ** (1/3) if t > 0.008856 else (7.787 * t) + (16.0 / 116.0)
+    xr, yr, zr = X / _XN, Y / _YN, Z / _ZN
+    fx = xr ** (1/3) if xr > 0.008856 else (7.787 * xr) + (16.0 / 116.0)
+    fy = yr ** (1/3) if yr > 0.008856 else (7.787 * yr) + (16.0 / 116.0)
+    fz = zr ** (1/3) if zr > 0.008856 else (7.787 * zr) + (16.0 / 116.0)
     
-    fx, fy, fz = f(xr), f(yr), f(zr)
     L = max(0.0, 116.0 * fy - 16.0)
     a = 500.0 * (fx - fy)
     b = 200.0 * (fy - fz)
@@ -34,173 +55,229 @@ def rgb_to_lab(r, g, b):
     return (L, a, b)
 
 
+def _linear_to_srgb8(c):
+    """Linear channel value to a clamped 8-bit sRGB value."""
+    c = max(0.0, min(1.0, c))
+    v = 12.92 * c if c <= 0.0031308 else 1.055 * (c ** (1.0 / 2.4)) - 0.055
+    return max(0, min(255, int(round(v * 255.0))))
+
+
 def lab_to_rgb(L, a, b):
     """Convert LAB to RGB color space."""
     # LAB to XYZ
-    Xn, Yn, Zn = 0.95047, 1.00000, 1.08883
     fy = (L + 16.0) / 116.0
     fx = a / 500.0 + fy
     fz = fy - b / 200.0
     
-    def f_inv(t):
-        t3 = t ** 3
-        return t3 if t3 > 0.008856 else (t - 16.0 / 116.0) / 7.787
-    
-    xr, yr, zr = f_inv(fx), f_inv(fy), f_inv(fz)
-    X, Y, Z = xr * Xn, yr * Yn, zr * Zn
+    t3 = fx ** 3
+    X = (t3 if t3 > 0.008856 else (fx - 16.0 / 116.0) / 7.787) * _XN
+    t3 = fy ** 3
+    Y = (t3 if t3 > 0.008856 else (fy - 16.0 / 116.0) / 7.787) * _YN
+    t3 = fz ** 3
+    Z = (t3 if t3 > 0.008856 else (fz - 16.0 / 116.0) / 7.787) * _ZN
     
     # XYZ to linear RGB
     rl = X *  3.2404542 + Y * -1.5371385 + Z * -0.4985314
     gl = X * -0.9692660 + Y *  1.8760108 + Z *  0.0415560
     bl = X *  0.0556434 + Y * -0.2040259 + Z *  1.0572252
     
-    # Linear RGB to sRGB
-    def linear_to_srgb(c):
-        c = max(0.0, min(1.0, c))
-        v = 12.92 * c if c <= 0.0031308 else 1.055 * (c ** (1.0 / 2.4)) - 0.055
-        return max(0, min(255, int(round(v * 255.0))))
+    return (_linear_to_srgb8(rl), _linear_to_srgb8(gl), _linear_to_srgb8(bl))
+
+
+# sRGB (D65) <-> XYZ matrices and reference white
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_XYZ_TO_RGB = np.array([
+    [ 3.2404542, -1.5371385, -0.4985314],
+    [-0.9692660,  1.8760108,  0.0415560],
+    [ 0.0556434, -0.2040259,  1.0572252],
+])
+_WHITE = np.array([_XN, _YN, _ZN])
+
+# Same matrices with the reference-white scaling folded in, so the batched
+# converters go between linear RGB and white-relative XYZ in one matmul
+_RGB_TO_XYZN = _RGB_TO_XYZ / _WHITE[:, None]
+_XYZN_TO_RGB = _XYZ_TO_RGB * _WHITE
+
+# sRGB -> linear for every 8-bit channel value, so conversions need no pow()
+_SRGB_TO_LINEAR = np.arange(256) / 255.0
+_SRGB_TO_LINEAR = np.where(
+    _SRGB_TO_LINEAR <= 0.04045,
+    _SRGB_TO_LINEAR / 12.92,
+    ((_SRGB_TO_LINEAR + 0.055) / 1.055) ** 2.4
+)
+
+
+def rgb_to_lab_batch(rgb) -> np.ndarray:
+    """Convert an (N, 3) array of 8-bit RGB colors to LAB (same math as rgb_to_lab)."""
+    lin = _SRGB_TO_LINEAR[np.asarray(rgb, dtype=np.intp)]
     
-    return (linear_to_srgb(rl), linear_to_srgb(gl), linear_to_srgb(bl))
+    t = lin @ _RGB_TO_XYZN.T
+    f = np.where(t > 0.008856, np.cbrt(t), 7.787 * t + 16.0 / 116.0)
+    
+    lab = np.empty_like(f)
+    lab[:, 0] = np.maximum(0.0, 116.0 * f[:, 1] - 16.0)
+    lab[:, 1] = 500.0 * (f[:, 0] - f[:, 1])
+    lab[:, 2] = 200.0 * (f[:, 1] - f[:, 2])
+    return lab
+
+
+def lab_to_rgb_batch(lab) -> np.ndarray:
+    """Convert an (N, 3) array of LAB colors to 8-bit RGB (same math as lab_to_rgb)."""
+    lab = np.asarray(lab, dtype=np.float64)
+    fy = (lab[:, 0] + 16.0) / 116.0
+    f = np.stack([lab[:, 1] / 500.0 + fy, fy, fy - lab[:, 2] / 200.0], axis=1)
+    
+    f3 = f ** 3
+    t = np.where(f3 > 0.008856, f3, (f - 16.0 / 116.0) / 7.787)
+    lin = np.clip(t @ _XYZN_TO_RGB.T, 0.0, 1.0)
+    
+    v = np.where(lin <= 0.0031308, 12.92 * lin, 1.055 * lin ** (1.0 / 2.4) - 0.055)
+    return np.clip(np.rint(v * 255.0), 0, 255).astype(np.uint8)
 
 
 def deltaE76(lab1, lab2):
     """Calculate color difference in LAB space."""
-    return math.sqrt(sum((a - b) ** 2 for a, b in zip(lab1, lab2)))
+    return math.dist(lab1, lab2)
+
+
+# Offsets to a grid cell and its 26 neighbors
+_NEIGHBOR_CELLS = [
+    (dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+]
 
 
-def process_image(input_path: Path, output_path: Path, settings: dict):
+def process_image(input_path: Path, output_path: Path, settings: ProcessSettings):
     """Process a single image with all transformations."""
     img = Image.open(input_path).convert("RGBA")
-    px = img.load()
-    w, h = img.size
+    arr = np.array(img, dtype=np.uint8)
     
-    # Step 1: Opacity normalization
-    alpha_low = settings['alpha_low_cutoff']
-    alpha_high_min = settings['alpha_high_min']
-    alpha_high_max = settings['alpha_high_max']
+    # Step 1: Opacity normalization (whole alpha plane at once)
+    alpha_low = settings.alpha_low_cutoff
+    alpha_high_min = settings.alpha_high_min
+    alpha_high_max = settings.alpha_high_max
     
-    for y in range(h):
-        for x in range(w):
-            r, g, b, a = px[x, y]
-            
-            if a < alpha_low:
-                px[x, y] = (r, g, b, 0)
-            elif alpha_high_min <= a <= alpha_high_max:
-                px[x, y] = (r, g, b, 255)
+    alpha_plane = arr[..., 3]
+    low = alpha_plane < alpha_low
+    high = ~low & (alpha_plane >= alpha_high_min) & (alpha_plane <= alpha_high_max)
+    alpha_plane[low] = 0
+    alpha_plane[high] = 255
     
     # Step 2: Color simplification
-    if settings['enable_color_simplify']:
-        threshold = settings['lab_merge_threshold']
+    if settings.enable_color_simplify:
+        threshold = settings.lab_merge_threshold
         
-        # Collect unique colors
-        color_counts = {}
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[x, y]
-                if a >= 1:
-                    key = (r, g, b)
-                    color_counts[key] = color_counts.get(key, 0) + 1
+        # Histogram of visible colors, packed as 0xRRGGBB
+        opaque = alpha_plane >= 1
+        rgb = arr[..., :3][opaque].astype(np.uint32)
+        packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+        vals, first, inverse, freq = np.unique(
+            packed, return_index=True, return_inverse=True, return_counts=True
+        )
         
-        if color_counts:
-            # Build LAB clusters
-            clusters = []
-            items = sorted(color_counts.items(), key=lambda kv: kv[1], reverse=True)
+        if vals.size:
+            # Build LAB clusters: colors in descending frequency join the first
+            # cluster whose center is within threshold, else start a new one.
+            # Ties keep first-seen order, as the old per-pixel scan did.
+            order = np.lexsort((first, -freq))
+            palette = np.stack([vals >> 16, (vals >> 8) & 0xFF, vals & 0xFF], axis=1)
+            labs = rgb_to_lab_batch(palette[order])
+            
+            # At most one cluster per color, so size the center arrays up front
+            centers = np.empty((len(vals), 3))
+            sums = np.empty((len(vals), 3))
+            counts = np.empty(len(vals))
+            cluster_of = np.empty(len(vals), dtype=np.int32)
+            k = 0
+            threshold_sq = threshold * threshold
             
-            for (r, g, b), cnt in items:
-                lab = rgb_to_lab(r, g, b)
-                assigned = False
+            # Spatial hash of centers in cubes of side >= threshold: a center
+            # within threshold of a color is always in one of the 27 cubes
+            # around it, so only those few candidates are compared
+            cell_size = max(threshold, 1e-3) * (1.0 + 1e-9)
+            cells = np.floor(labs / cell_size).astype(np.int64).tolist()
+            grid = {}
+            cluster_cell = []
+            
+            for idx, cnt, lab, cell in zip(order.tolist(), freq[order].tolist(), labs, cells):
+                cx, cy, cz = cell
+                candidates = []
+                for dx, dy, dz in _NEIGHBOR_CELLS:
+                    ids = grid.get((cx + dx, cy + dy, cz + dz))
+                    if ids:
+                        candidates.extend(ids)
                 
-                for c in clusters:
-                    if deltaE76(lab, c['center_lab']) <= threshold:
-                        c['members'].append(((r, g, b), cnt))
-                        c['sumL'] += lab[0] * cnt
-                        c['suma'] += lab[1] * cnt
-                        c['sumb'] += lab[2] * cnt
-                        c['n'] += cnt
-                        c['center_lab'] = (c['sumL']/c['n'], c['suma']/c['n'], c['sumb']/c['n'])
-                        assigned = True
-                        break
+                if candidates:
+                    candidates = np.array(candidates)
+                    diff = centers[candidates] - lab
+                    hits = candidates[np.einsum('ij,ij->i', diff, diff) <= threshold_sq]
+                    if hits.size:
+                        # Earliest cluster wins, as in a front-to-back scan
+                        i = int(hits.min())
+                        sums[i] += lab * cnt
+                        counts[i] += cnt
+                        centers[i] = sums[i] / counts[i]
+                        cluster_of[idx] = i
+                        
+                        # Re-file the center if it drifted into another cube
+                        new_cell = tuple(np.floor(centers[i] / cell_size).astype(np.int64).tolist())
+                        if new_cell != cluster_cell[i]:
+                            grid[cluster_cell[i]].remove(i)
+                            grid.setdefault(new_cell, []).append(i)
+                            cluster_cell[i] = new_cell
+                        continue
                 
-                if not assigned:
-                    clusters.append({
-                        'center_lab': lab,
-                        'sumL': lab[0] * cnt,
-                        'suma': lab[1] * cnt,
-                        'sumb': lab[2] * cnt,
-                        'n': cnt,
-                        'members': [((r, g, b), cnt)]
-                    })
+                centers[k] = lab
+                sums[k] = lab * cnt
+                counts[k] = cnt
+                cluster_of[idx] = k
+                cell = (cx, cy, cz)
+                grid.setdefault(cell, []).append(k)
+                cluster_cell.append(cell)
+                k += 1
             
-            # Build color map
-            colormap = {}
-            for c in clusters:
-                rep = lab_to_rgb(*c['center_lab'])
-                for (rgb, _) in c['members']:
-                    colormap[rgb] = rep
+            # Replacement color per palette entry
+            table = lab_to_rgb_batch(centers[:k])[cluster_of]
             
-            # Apply color map
-            for y in range(h):
-                for x in range(w):
-                    r, g, b, a = px[x, y]
-                    if a >= 1:
-                        rgb = (r, g, b)
-                        if rgb in colormap:
-                            rep = colormap[rgb]
-                            px[x, y] = (rep[0], rep[1], rep[2], a)
+            # Gather the replacements for every visible pixel in one indexed write
+            arr[..., :3][opaque] = table[inverse]
     
     # Step 3: Outline generation
-    outline_color = settings['outline_color']
-    connectivity = settings['connectivity']
-    thickness = settings['thickness']
-    edge_cutoff = settings['edge_cutoff']
-    
-    # Get alpha channel
-    alpha = [[px[x, y][3] for x in range(w)] for y in range(h)]
-    
-    # Build outline mask
-    mask = [[False]*w for _ in range(h)]
-    
-    def get_neighbors(x, y):
-        neighbors = []
-        if connectivity == 4:
-            if x > 0: neighbors.append((x-1, y))
-            if x < w-1: neighbors.append((x+1, y))
-            if y > 0: neighbors.append((x, y-1))
-            if y < h-1: neighbors.append((x, y+1))
-        else:  # 8
-            for nx in range(max(0, x-1), min(w, x+2)):
-                for ny in range(max(0, y-1), min(h, y+2)):
-                    if not (nx == x and ny == y):
-                        neighbors.append((nx, ny))
-        return neighbors
-    
-    # Find border pixels
-    frontier = []
-    for y in range(h):
-        for x in range(w):
-            if alpha[y][x] > edge_cutoff:
-                for nx, ny in get_neighbors(x, y):
-                    if alpha[ny][nx] <= edge_cutoff:
-                        mask[y][x] = True
-                        frontier.append((x, y))
-                        break
-    
-    # Grow inward for thickness
-    for _ in range(1, thickness):
-        new_frontier = []
-        for x, y in frontier:
-            for nx, ny in get_neighbors(x, y):
-                if alpha[ny][nx] > edge_cutoff and not mask[ny][nx]:
-                    mask[ny][nx] = True
-                    new_frontier.append((nx, ny))
-        frontier = new_frontier
-    
-    # Apply outline
-    for y in range(h):
-        for x in range(w):
-            if mask[y][x]:
-                px[x, y] = outline_color
+    outline_color = settings.outline_color
+    connectivity = settings.connectivity
+    thickness = settings.thickness
+    edge_cutoff = settings.edge_cutoff
+    
+    # Solid pixels; alpha is unchanged since step 1, so reuse its zero-copy view
+    solid = alpha_plane > edge_cutoff
+    
+    # Outline pixels can only lie in the solid region's bounding box, so work on
+    # that box plus a one-pixel transparent ring (sprites often have wide margins)
+    rows = np.flatnonzero(solid.any(axis=1))
+    if rows.size:
+        cols = np.flatnonzero(solid.any(axis=0))
+        y0, y1 = max(rows[0] - 1, 0), rows[-1] + 2
+        x0, x1 = max(cols[0] - 1, 0), cols[-1] + 2
+        window = solid[y0:y1, x0:x1]
+        
+        # The outline is every solid pixel within `thickness` steps of a transparent
+        # one. Eroding that many times leaves exactly the rest; the border counts as
+        # solid so the image edge itself is not outlined. SciPy treats iterations < 1
+        # as "erode until nothing changes", so clamp to the 1 px outline drawn before.
+        structure = generate_binary_structure(2, 1 if connectivity == 4 else 2)
+        interior = binary_erosion(window, structure=structure, iterations=max(thickness, 1), border_value=1)
+        # interior is a subset of window, so XOR in place gives window & ~interior
+        # without allocating another mask
+        mask = np.logical_xor(window, interior, out=interior)
+        
+        # Apply outline: view each RGBA pixel as one uint32 so every outline pixel
+        # is a single 4-byte store (byte order is kept by viewing the color the same way)
+        pixels = arr.view(np.uint32)[y0:y1, x0:x1, 0]
+        pixels[mask] = np.array(outline_color, dtype=np.uint8).view(np.uint32)[0]
     
     # Save
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(output_path)
\ No newline at end of file
+    Image.fromarray(arr, "RGBA").save(output_path)
@@ -4,6 +4,7 @@ Detects true pixel resolution from AI-upscaled images.
 SCALING LOGIC PRESERVED FROM ORIGINAL SCRIPT.
 """
 import math
+from dataclasses import dataclass
 import numpy as np
 from pathlib import Path
 from PIL import Image
@@ -11,6 +12,27 @@ from scipy import ndimage
 from collections import Counter
 
 
+@dataclass(frozen=True, slots=True)
+class DownscaleSettings:
+    """Immutable downscale options, cheap to pickle for worker processes.
+    
+    The algorithm options have no defaults here; SettingsManager.DEFAULTS
+    holds them, e.g. DownscaleSettings(**settings.get_all_downscale_settings()).
+    """
+    enable_fine_tune: bool
+    bg_removal_mode: str
+    bg_tolerance: int
+    bg_edge_tolerance: int
+    preserve_dark_lines: bool
+    dark_line_threshold: int
+    auto_trim: bool
+    pad_canvas: bool
+    canvas_multiple: int
+    use_filename_transform: bool = False
+    filename_prefix: str = ""
+    filename_suffix: str = ""
+
+
 # ============================================================================
 # IMPROVED BACKGROUND REMOVAL
 # ============================================================================
@@ -137,9 +159,9 @@ def binary_propagation(mask, seed):
     return result
 
 
-def remove_background_improved(im, settings):
+def remove_background_improved(im, settings: DownscaleSettings):
     """Improved background removal with content preservation."""
-    mode = settings.get('bg_removal_mode', 'conservative')
+    mode = settings.bg_removal_mode
     
     if mode == 'none':
         return im
@@ -148,10 +170,10 @@ def remove_background_improved(im, settings):
     arr = np.array(im)
     h, w = arr.shape[:2]
     
-    tolerance = settings.get('bg_tolerance', 15)
-    edge_tolerance = settings.get('bg_edge_tolerance', 25)
-    preserve_dark_lines = settings.get('preserve_dark_lines', True)
-    dark_threshold = settings.get('dark_line_threshold', 50)
+    tolerance = settings.bg_tolerance
+    edge_tolerance = settings.bg_edge_tolerance
+    preserve_dark_lines = settings.preserve_dark_lines
+    dark_threshold = settings.dark_line_threshold
     
     # Detect dark lines
     dark_line_mask = np.zeros((h, w), dtype=bool)
@@ -458,7 +480,7 @@ def pad_to_multiple(im, multiple=16):
 # MAIN PROCESSING PIPELINE
 # ============================================================================
 
-def downscale_image(input_path: Path, output_path: Path, settings: dict) -> dict:
+def downscale_image(input_path: Path, output_path: Path, settings: DownscaleSettings) -> dict:
     """Process a single AI-generated image to find true pixel resolution."""
     im = Image.open(input_path).convert("RGBA")
     original_size = (im.width, im.height)
@@ -467,7 +489,7 @@ def downscale_image(input_path: Path, output_path: Path, settings: dict) -> dict
     im = remove_background_improved(im, settings)
     
     # Step 2: Trim transparency
-    if settings.get('auto_trim', True):
+    if settings.auto_trim:
         im = trim_transparency(im)
     
     after_cleanup_size = (im.width, im.height)
@@ -476,13 +498,12 @@ def downscale_image(input_path: Path, output_path: Path, settings: dict) -> dict
     result, factor, grid_size = find_optimal_scale(im, min_factor=6, max_factor=20)
     
     # Step 4: Fine-tune if enabled
-    if settings.get('enable_fine_tune', True) and result.width >= 16 and result.height >= 16:
+    if settings.enable_fine_tune and result.width >= 16 and result.height >= 16:
         result, factor = fine_tune_scale(im, factor, grid_size)
     
     # Step 5: Pad canvas to multiple if enabled
-    if settings.get('pad_canvas', True):
-        multiple = settings.get('canvas_multiple', 16)
-        result = pad_to_multiple(result, multiple)
+    if settings.pad_canvas:
+        result = pad_to_multiple(result, settings.canvas_multiple)
     
     # Save result
     output_path.parent.mkdir(parents=True, exist_ok=True)
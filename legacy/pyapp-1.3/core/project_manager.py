@@ -1,8 +1,9 @@
 """
 Project management - lightweight system for storing project directories and per-project settings.
 """
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from PySide6.QtCore import QSettings
 
 
@@ -30,10 +31,42 @@ class ProjectManager:
     def __init__(self, settings: QSettings):
         self.settings = settings
         self.current_project: Optional[Project] = None
+        self.revision = 0  # Bumped whenever the projects list is saved
+        self._batch: Optional[Dict[str, Any]] = None
+        
+    @contextmanager
+    def batch(self):
+        """Hold project list writes made inside the block and flush them once on exit."""
+        if self._batch is not None:
+            # Nested: the outermost block writes
+            yield
+            return
+        
+        self._batch = {}
+        try:
+            yield
+        finally:
+            pending, self._batch = self._batch, None
+            for key, value in pending.items():
+                self.settings.setValue(key, value)
+            self.settings.sync()
+    
+    def _read(self, key: str, default=None):
+        """Read a value, seeing writes still held by batch()."""
+        if self._batch is not None and key in self._batch:
+            return self._batch[key]
+        return self.settings.value(key, default)
+    
+    def _write(self, key: str, value):
+        """Write a value, or hold it until the current batch() block ends."""
+        if self._batch is not None:
+            self._batch[key] = value
+        else:
+            self.settings.setValue(key, value)
         
     def get_projects(self) -> List[Project]:
         """Get all saved projects."""
-        projects_data = self.settings.value("projects/list", [])
+        projects_data = self._read("projects/list", [])
         if not projects_data:
             return []
         
@@ -78,15 +111,16 @@ class ProjectManager:
     def save_projects(self, projects: List[Project]):
         """Save projects list."""
         projects_data = [p.to_dict() for p in projects]
-        self.settings.setValue("projects/list", projects_data)
+        self._write("projects/list", projects_data)
+        self.revision += 1
     
     def set_current_project(self, project: Optional[Project]):
         """Set the current active project."""
         self.current_project = project
         if project:
-            self.settings.setValue("projects/current", str(project.path))
+            self._write("projects/current", str(project.path))
         else:
-            self.settings.setValue("projects/current", None)
+            self._write("projects/current", None)
     
     def get_current_project(self) -> Optional[Project]:
         """Get current project, loading from settings if needed."""
@@ -94,7 +128,7 @@ class ProjectManager:
             return self.current_project
         
         # Try to load from settings
-        current_path = self.settings.value("projects/current")
+        current_path = self._read("projects/current")
         if current_path:
             projects = self.get_projects()
             for proj in projects:
@@ -120,6 +154,24 @@ class ProjectManager:
         #print(f"[ProjectManager] Setting {tab_name} folder: key={key}, value={folder}")  # Debug
         self.settings.setValue(key, str(folder))
 
+    def get_project_folders(self, project: Project, tab_names: List[str]) -> Dict[str, Optional[Path]]:
+        """Get the folder paths for several tabs in a project at once."""
+        self.settings.beginGroup(f"project:{project.path}/folders")
+        try:
+            values = {tab_name: self.settings.value(tab_name) for tab_name in tab_names}
+        finally:
+            self.settings.endGroup()
+        return {tab_name: Path(value) if value else None for tab_name, value in values.items()}
+
+    def set_project_folders(self, project: Project, folders: Dict[str, Path]):
+        """Set the folder paths for several tabs in a project at once."""
+        self.settings.beginGroup(f"project:{project.path}/folders")
+        try:
+            for tab_name, folder in folders.items():
+                self.settings.setValue(tab_name, str(folder))
+        finally:
+            self.settings.endGroup()
+
     # Per-project settings
     def get_project_setting(self, project: Project, key: str, default=None):
         """Get a project-specific setting."""
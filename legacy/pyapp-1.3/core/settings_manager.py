@@ -1,5 +1,6 @@
+import sys
 from PySide6.QtCore import QSettings
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
 
 class SettingsManager:
@@ -41,10 +42,16 @@ class SettingsManager:
         
         # UI defaults
         "last_directory": "",
+        "use_native_dialogs": sys.platform != "win32",  # Native picker can stall on Windows
         "window_geometry": None,
         "window_state": None,
     }
     
+    # Downscale options returned by get_all_downscale_settings()
+    DOWNSCALE_KEYS = tuple(
+        key[len("downscale/"):] for key in DEFAULTS if key.startswith("downscale/")
+    )
+    
     def __init__(self):
         self.settings = QSettings()
         
@@ -53,8 +60,11 @@ class SettingsManager:
         if default is None:
             default = self.DEFAULTS.get(key)
         
-        value = self.settings.value(key, default)
+        return self._convert(self.settings.value(key, default), default)
         
+    @staticmethod
+    def _convert(value: Any, default: Any) -> Any:
+        """Coerce a stored value to the type of its default."""
         # Handle tuple conversion (QSettings stores as list)
         if isinstance(default, tuple) and isinstance(value, list):
             return tuple(value)
@@ -76,6 +86,38 @@ class SettingsManager:
         """Set a setting value."""
         self.settings.setValue(key, value)
         
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several setting values at once, keyed by setting name.
+        
+        Keys are read group by group inside one beginGroup()/endGroup() pass.
+        QSettings already serves reads from its in-memory cache, so this saves
+        key-path handling rather than disk access.
+        """
+        groups: Dict[str, list] = {}
+        for key in keys:
+            group, _, name = key.rpartition("/")
+            groups.setdefault(group, []).append(name)
+        
+        values = {}
+        for group, names in groups.items():
+            if group:
+                self.settings.beginGroup(group)
+            try:
+                for name in names:
+                    key = f"{group}/{name}" if group else name
+                    default = self.DEFAULTS.get(key)
+                    values[key] = self._convert(self.settings.value(name, default), default)
+            finally:
+                if group:
+                    self.settings.endGroup()
+        return values
+        
+    def set_many(self, values: Dict[str, Any]):
+        """Set several setting values at once, then flush them to storage together."""
+        for key, value in values.items():
+            self.settings.setValue(key, value)
+        self.settings.sync()
+        
     def reset(self):
         """Reset all settings to defaults."""
         self.settings.clear()
@@ -108,15 +150,49 @@ class SettingsManager:
         }
     
     def get_all_downscale_settings(self) -> dict:
-        """Get all downscale settings as a dictionary."""
-        return {
-            "enable_fine_tune": self.get("downscale/enable_fine_tune"),
-            "bg_removal_mode": self.get("downscale/bg_removal_mode"),
-            "bg_tolerance": self.get("downscale/bg_tolerance"),
-            "bg_edge_tolerance": self.get("downscale/bg_edge_tolerance"),
-            "preserve_dark_lines": self.get("downscale/preserve_dark_lines"),
-            "dark_line_threshold": self.get("downscale/dark_line_threshold"),
-            "auto_trim": self.get("downscale/auto_trim"),
-            "pad_canvas": self.get("downscale/pad_canvas"),
-            "canvas_multiple": self.get("downscale/canvas_multiple"),
-        }
\ No newline at end of file
+        """Get all downscale settings as a dictionary, keyed without the group prefix."""
+        values = self.get_many(f"downscale/{key}" for key in self.DOWNSCALE_KEYS)
+        return {key[len("downscale/"):]: value for key, value in values.items()}
+
+
+class DirtyWriter:
+    """Buffers setting writes and flushes only values that changed.
+    
+    Values last loaded or written are remembered, so staging an unchanged
+    value is a no-op and flush() touches storage only for real edits.
+    """
+    
+    _UNSET = object()
+    
+    def __init__(self, write: Callable[[str, Any], None]):
+        self._write = write
+        self._known: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        
+    def set(self, key: str, value: Any):
+        """Stage a value; dropped if it matches what storage already holds."""
+        if self._known.get(key, self._UNSET) == value:
+            self._pending.pop(key, None)
+        else:
+            self._pending[key] = value
+            
+    def update(self, values: Dict[str, Any]):
+        """Stage several values."""
+        for key, value in values.items():
+            self.set(key, value)
+            
+    def mark_clean(self, values: Dict[str, Any]):
+        """Record values known to be in storage already (e.g. just loaded)."""
+        self._known.update(values)
+        
+    def reset(self):
+        """Forget known and pending values (e.g. when the target changes)."""
+        self._known.clear()
+        self._pending.clear()
+        
+    def flush(self):
+        """Write all staged changes."""
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            self._write(key, value)
+            self._known[key] = value
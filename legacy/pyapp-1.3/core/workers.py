@@ -1,11 +1,50 @@
+import multiprocessing
+import os
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
-from core.image_processor import process_image
+from core.image_processor import ProcessSettings, process_image
 from core.sprite_packer import pack_sprites
-from core.pixel_downscaler import downscale_image
+from core.pixel_downscaler import DownscaleSettings, downscale_image
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# Placeholder for files whose job raised
+_FAILED = object()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for CPU-bound image work, started on first use.
+    
+    Reusing it across batches avoids spawning fresh workers (each importing
+    NumPy, SciPy and Pillow) every time the user presses Process. Workers are
+    spawned, not forked: the pool is created from a worker thread of a running
+    Qt app, and forking a multithreaded process can deadlock.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next batch starts a new one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
 
 
 class WorkerSignals(QObject):
@@ -15,50 +54,116 @@ class WorkerSignals(QObject):
     progress = Signal(object)
 
 
-class ProcessWorker(QRunnable):
-    """Worker for processing images in background thread."""
+class ImageBatchWorker(QRunnable):
+    """Base for workers that run one image job per file in a background thread.
+    
+    Batches of PARALLEL_MIN_FILES or more are spread across the shared process
+    pool, since the jobs are CPU-bound and would otherwise hold the GIL.
+    Subclasses set job, job_name and keep_extension, and may override _finish.
+    """
+    
+    PARALLEL_MIN_FILES = 4
+    job = None  # Module-level function called as job(input_path, output_path, settings)
+    job_name = "processing"  # Used in per-file error messages
+    keep_extension = True  # Untransformed outputs keep the input name, else become <stem>.png
     
-    def __init__(self, files: List[Path], output_dir: Path, settings: dict):
+    def __init__(self, files: List[Path], output_dir: Path, settings: Union[ProcessSettings, DownscaleSettings]):
         super().__init__()
         self.files = files
         self.output_dir = output_dir
         self.settings = settings
         self.signals = WorkerSignals()
         
+    def _output_path(self, file_path: Path) -> Path:
+        """Determine output path for an input file."""
+        settings = self.settings
+        if settings.use_filename_transform:
+            output_name = f"{settings.filename_prefix}{file_path.stem}{settings.filename_suffix}.png"
+        elif self.keep_extension:
+            output_name = file_path.name
+        else:
+            output_name = f"{file_path.stem}.png"
+        return self.output_dir / output_name
+        
+    def _finish(self, results: list):
+        """Turn the successful job results (in input order) into the finished payload."""
+        return results
+        
     @Slot()
     def run(self):
-        """Execute the processing."""
+        """Execute the batch."""
         try:
-            total = len(self.files)
-            processed = 0
+            workers = os.cpu_count() or 1
+            if len(self.files) >= self.PARALLEL_MIN_FILES and workers > 1:
+                results = self._run_parallel()
+            else:
+                results = self._run_serial()
+                    
+            self.signals.finished.emit(self._finish(results))
             
-            for i, file_path in enumerate(self.files, 1):
-                # Emit progress with current/total/filename
-                self.signals.progress.emit((i, total, file_path.name))
-                
-                # Determine output filename
-                use_transform = self.settings.get('use_filename_transform', False)
-                if use_transform:
-                    prefix = self.settings.get('filename_prefix', '')
-                    suffix = self.settings.get('filename_suffix', '')
-                    output_name = f"{prefix}{file_path.stem}{suffix}.png"
-                else:
-                    output_name = file_path.name
-                
-                output_path = self.output_dir / output_name
+        except Exception as e:
+            self.signals.error.emit(f"{str(e)}\n\n{traceback.format_exc()}")
+            
+    def _report_failure(self, file_path: Path, error: Exception):
+        """Log a file that failed; the rest of the batch carries on."""
+        print(f"Error {self.job_name} {file_path.name}: {error}")
+        traceback.print_exc()
+            
+    def _run_serial(self) -> list:
+        """Run the job on files one after another in this thread."""
+        total = len(self.files)
+        results = []
+        
+        for i, file_path in enumerate(self.files, 1):
+            # Emit progress with current/total/filename
+            self.signals.progress.emit((i, total, file_path.name))
+            
+            try:
+                results.append(self.job(file_path, self._output_path(file_path), self.settings))
+            except Exception as e:
+                self._report_failure(file_path, e)
                 
-                # Process image
+        return results
+        
+    def _run_parallel(self) -> list:
+        """Run the job across the shared pool, reporting progress as each file completes."""
+        total = len(self.files)
+        results = [_FAILED] * total
+        
+        executor = get_process_pool()
+        try:
+            futures = {
+                executor.submit(self.job, file_path, self._output_path(file_path), self.settings): index
+                for index, file_path in enumerate(self.files)
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                file_path = self.files[index]
+                self.signals.progress.emit((i, total, file_path.name))
                 try:
-                    process_image(file_path, output_path, self.settings)
-                    processed += 1
+                    results[index] = future.result()
+                except BrokenProcessPool:
+                    raise
                 except Exception as e:
-                    print(f"Error processing {file_path.name}: {e}")
-                    traceback.print_exc()
+                    # The worker's traceback is chained onto e, so it is printed too
+                    self._report_failure(file_path, e)
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); don't reuse the pool
+            _discard_process_pool(executor)
+            raise
                     
-            self.signals.finished.emit(processed)
-            
-        except Exception as e:
-            self.signals.error.emit(f"{str(e)}\n\n{traceback.format_exc()}")
+        return [result for result in results if result is not _FAILED]
+
+
+class ProcessWorker(ImageBatchWorker):
+    """Worker for processing images in background thread; finishes with the processed count."""
+    
+    job = staticmethod(process_image)
+    job_name = "processing"
+    keep_extension = True
+        
+    def _finish(self, results: list) -> int:
+        return len(results)
 
 
 class PackWorker(QRunnable):
@@ -90,47 +195,9 @@ class PackWorker(QRunnable):
             self.signals.error.emit(f"{str(e)}\n\n{traceback.format_exc()}")
 
 
-class DownscaleWorker(QRunnable):
-    """Worker for downscaling AI images in background thread."""
+class DownscaleWorker(ImageBatchWorker):
+    """Worker for downscaling AI images in background thread; finishes with the result infos."""
     
-    def __init__(self, files: List[Path], output_dir: Path, settings: dict):
-        super().__init__()
-        self.files = files
-        self.output_dir = output_dir
-        self.settings = settings
-        self.signals = WorkerSignals()
-        
-    @Slot()
-    def run(self):
-        """Execute the downscaling."""
-        try:
-            total = len(self.files)
-            results = []
-            
-            for i, file_path in enumerate(self.files, 1):
-                # Emit progress
-                self.signals.progress.emit((i, total, file_path.name))
-                
-                # Determine output filename
-                use_transform = self.settings.get('use_filename_transform', False)
-                if use_transform:
-                    prefix = self.settings.get('filename_prefix', '')
-                    suffix = self.settings.get('filename_suffix', '')
-                    output_name = f"{prefix}{file_path.stem}{suffix}.png"
-                else:
-                    output_name = f"{file_path.stem}.png"
-                
-                output_path = self.output_dir / output_name
-                
-                # Downscale image
-                try:
-                    result_info = downscale_image(file_path, output_path, self.settings)
-                    results.append(result_info)
-                except Exception as e:
-                    print(f"Error downscaling {file_path.name}: {e}")
-                    traceback.print_exc()
-                    
-            self.signals.finished.emit(results)
-            
-        except Exception as e:
-            self.signals.error.emit(f"{str(e)}\n\n{traceback.format_exc()}")
\ No newline at end of file
+    job = staticmethod(downscale_image)
+    job_name = "downscaling"
+    keep_extension = False
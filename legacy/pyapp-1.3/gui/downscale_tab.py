@@ -1,3 +1,5 @@
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
@@ -5,24 +7,75 @@ from PySide6.QtWidgets import (
     QPushButton, QScrollArea, QMessageBox, QSlider,
     QLineEdit, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot, QThreadPool
+from PySide6.QtCore import Qt, Signal, Slot, QSignalBlocker, QThreadPool, QTimer
 
-from gui.widgets.image_list_widget import ImageListWidget
+from gui.file_dialogs import directory_options
+from gui.widgets.image_list_widget import ImageListWidget, clear_cache
+from core.pixel_downscaler import DownscaleSettings
 from core.workers import DownscaleWorker
-from core.settings_manager import SettingsManager
+from core.settings_manager import SettingsManager, DirtyWriter
 from core.project_manager import ProjectManager, Project
 
+# Primary action button style, kept at module level so it's built once
+_DOWNSCALE_BTN_QSS = """
+    QPushButton {
+        background-color: #5294E2;
+        color: #FFFFFF;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #6BA4F2;
+    }
+    QPushButton:disabled {
+        background-color: #888888;
+        color: #CCCCCC;
+    }
+"""
+
 
 class DownscaleTab(QWidget):
     """Tab for downscaling AI-generated images to true pixel resolution."""
     
+    # Emitted with the image folder whenever the tab switches to a new one
+    folder_changed = Signal(object)
+    
+    # View toggle text, indexed by whether list mode is active
+    _VIEW_LABELS = ("📋 List View", "🖼️ Thumbnail View")
+    
     def __init__(self, settings: SettingsManager, project_manager: ProjectManager, parent=None):
         super().__init__(parent)
         self.settings = settings
         self.project_manager = project_manager
-        self.threadpool = QThreadPool()
+        self.threadpool = QThreadPool.globalInstance()
         self.current_folder = None
         self.current_project = None
+        # Set while widgets are filled from stored settings
+        self._loading = False
+        
+        # Latest output line-edit text, cached from textChanged
+        self._output_folder = ""
+        self._prefix = ""
+        self._suffix = ""
+        
+        # Coalesce output-setting edits into a single save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self.save_settings)
+        
+        # Button progress text is repainted at most every 100 ms during a run
+        self._progress = None
+        self._shown_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Only keys whose values changed reach storage
+        self._settings_writer = DirtyWriter(self.settings.set)
+        self._project_writer = DirtyWriter(
+            lambda key, value: self.project_manager.set_project_setting(self.current_project, key, value)
+        )
         
         self.init_ui()
         self.load_settings()
@@ -44,7 +97,7 @@ class DownscaleTab(QWidget):
         folder_layout.addStretch()
         
         # View mode toggle button
-        self.view_toggle_btn = QPushButton("📋 List View")
+        self.view_toggle_btn = QPushButton(self._VIEW_LABELS[False])
         self.view_toggle_btn.setToolTip("Switch between thumbnail and list view")
         self.view_toggle_btn.setCheckable(True)
         self.view_toggle_btn.clicked.connect(self.toggle_view_mode)
@@ -99,16 +152,15 @@ class DownscaleTab(QWidget):
         output_layout = QVBoxLayout()
         
         # Output folder
-        folder_layout = QHBoxLayout()
-        folder_layout.addWidget(QLabel("Output Folder:"))
         self.output_folder_edit = QLineEdit()
         self.output_folder_edit.setPlaceholderText("downscaled")
-        self.output_folder_edit.textChanged.connect(self.on_output_settings_changed)
-        folder_layout.addWidget(self.output_folder_edit)
+        self.output_folder_edit.textChanged.connect(self.on_output_folder_text_changed)
+        self.output_folder_edit.editingFinished.connect(self.on_output_settings_changed)
         self.browse_output_btn = QPushButton("Browse")
         self.browse_output_btn.clicked.connect(self.browse_output_folder)
-        folder_layout.addWidget(self.browse_output_btn)
-        output_layout.addLayout(folder_layout)
+        output_layout.addLayout(
+            self._row("Output Folder:", self.output_folder_edit, self.browse_output_btn)
+        )
         
         # Filename transform
         self.use_transform_check = QCheckBox("Use Filename Prefix/Suffix")
@@ -118,18 +170,17 @@ class DownscaleTab(QWidget):
         output_layout.addWidget(self.use_transform_check)
         
         # Prefix/Suffix
-        transform_layout = QHBoxLayout()
-        transform_layout.addWidget(QLabel("Prefix:"))
         self.prefix_edit = QLineEdit()
         self.prefix_edit.setPlaceholderText("")
-        self.prefix_edit.textChanged.connect(self.on_output_settings_changed)
-        transform_layout.addWidget(self.prefix_edit)
-        transform_layout.addWidget(QLabel("Suffix:"))
+        self.prefix_edit.textChanged.connect(self.on_prefix_text_changed)
+        self.prefix_edit.editingFinished.connect(self.on_output_settings_changed)
         self.suffix_edit = QLineEdit()
         self.suffix_edit.setPlaceholderText("")
-        self.suffix_edit.textChanged.connect(self.on_output_settings_changed)
-        transform_layout.addWidget(self.suffix_edit)
-        output_layout.addLayout(transform_layout)
+        self.suffix_edit.textChanged.connect(self.on_suffix_text_changed)
+        self.suffix_edit.editingFinished.connect(self.on_output_settings_changed)
+        output_layout.addLayout(
+            self._row("Prefix:", self.prefix_edit, QLabel("Suffix:"), self.suffix_edit)
+        )
         
         output_info = QLabel(
             "<i><small>Smart Select uses these settings to check if files already exist.</small></i>"
@@ -163,8 +214,6 @@ class DownscaleTab(QWidget):
         bg_group = QGroupBox("Background Removal")
         bg_layout = QVBoxLayout()
         
-        mode_layout = QHBoxLayout()
-        mode_layout.addWidget(QLabel("Removal Mode:"))
         self.bg_mode_combo = QComboBox()
         self.bg_mode_combo.addItems(["Conservative (Safe)", "Aggressive", "None (Skip)"])
         self.bg_mode_combo.setToolTip(
@@ -173,8 +222,7 @@ class DownscaleTab(QWidget):
             "None: Skip background removal entirely"
         )
         self.bg_mode_combo.currentIndexChanged.connect(self.on_mode_changed)
-        mode_layout.addWidget(self.bg_mode_combo)
-        bg_layout.addLayout(mode_layout)
+        bg_layout.addLayout(self._row("Removal Mode:", self.bg_mode_combo))
         
         tol_layout = QVBoxLayout()
         tol_layout.addWidget(QLabel("Background Tolerance:"))
@@ -213,13 +261,10 @@ class DownscaleTab(QWidget):
         self.preserve_lines_check.setToolTip("Protect dark outlines from being removed as background")
         preserve_layout.addWidget(self.preserve_lines_check)
         
-        dark_layout = QHBoxLayout()
-        dark_layout.addWidget(QLabel("Dark Line Threshold:"))
         self.dark_threshold_spin = QSpinBox()
         self.dark_threshold_spin.setRange(0, 150)
         self.dark_threshold_spin.setToolTip("RGB sum below this is considered 'dark' (0=black, 255=mid-gray)")
-        dark_layout.addWidget(self.dark_threshold_spin)
-        preserve_layout.addLayout(dark_layout)
+        preserve_layout.addLayout(self._row("Dark Line Threshold:", self.dark_threshold_spin))
         
         preserve_group.setLayout(preserve_layout)
         settings_layout.addWidget(preserve_group)
@@ -239,15 +284,12 @@ class DownscaleTab(QWidget):
         self.pad_canvas_check.toggled.connect(self.on_pad_canvas_toggled)
         canvas_layout.addWidget(self.pad_canvas_check)
         
-        multiple_layout = QHBoxLayout()
-        multiple_layout.addWidget(QLabel("Canvas Multiple:"))
         self.canvas_multiple_spin = QSpinBox()
         self.canvas_multiple_spin.setRange(8, 128)
         self.canvas_multiple_spin.setSingleStep(8)
         self.canvas_multiple_spin.setSuffix(" px")
         self.canvas_multiple_spin.setToolTip("Pad canvas to nearest multiple of this value (e.g., 16 or 32)")
-        multiple_layout.addWidget(self.canvas_multiple_spin)
-        canvas_layout.addLayout(multiple_layout)
+        canvas_layout.addLayout(self._row("Canvas Multiple:", self.canvas_multiple_spin))
         
         canvas_group.setLayout(canvas_layout)
         settings_layout.addWidget(canvas_group)
@@ -268,66 +310,88 @@ class DownscaleTab(QWidget):
         # Fixed button at bottom (outside scroll area)
         self.downscale_btn = QPushButton("🔍 Downscale Images")
         self.downscale_btn.setMinimumHeight(45)
-        self.downscale_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #5294E2;
-                color: #FFFFFF;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #6BA4F2;
-            }
-            QPushButton:disabled {
-                background-color: #888888;
-                color: #CCCCCC;
-            }
-        """)
+        self.downscale_btn.setStyleSheet(_DOWNSCALE_BTN_QSS)
+
         self.downscale_btn.clicked.connect(self.downscale_images)
         right_layout.addWidget(self.downscale_btn)
         
         main_layout.addWidget(right_widget, stretch=1)
     
+    @staticmethod
+    def _row(label: str, *widgets: QWidget) -> QHBoxLayout:
+        """Build a settings row: a label followed by its widgets."""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label))
+        for widget in widgets:
+            row.addWidget(widget)
+        return row
+    
     @Slot()
     def toggle_view_mode(self):
         """Toggle between thumbnail and list view."""
         is_list_mode = self.view_toggle_btn.isChecked()
         self.image_list.set_view_mode(not is_list_mode)
-        
-        if is_list_mode:
-            self.view_toggle_btn.setText("🖼️ Thumbnail View")
-        else:
-            self.view_toggle_btn.setText("📋 List View")
+        self.view_toggle_btn.setText(self._VIEW_LABELS[is_list_mode])
         
     def load_settings(self):
         """Load global settings."""
-        self.fine_tune_check.setChecked(self.settings.get("downscale/enable_fine_tune"))
-        
-        mode = self.settings.get("downscale/bg_removal_mode")
-        mode_index = {"conservative": 0, "aggressive": 1, "none": 2}.get(mode, 0)
-        self.bg_mode_combo.setCurrentIndex(mode_index)
-        
-        self.bg_tolerance_slider.setValue(self.settings.get("downscale/bg_tolerance"))
-        self.edge_tolerance_slider.setValue(self.settings.get("downscale/bg_edge_tolerance"))
-        self.preserve_lines_check.setChecked(self.settings.get("downscale/preserve_dark_lines"))
-        self.dark_threshold_spin.setValue(self.settings.get("downscale/dark_line_threshold"))
-        self.auto_trim_check.setChecked(self.settings.get("downscale/auto_trim"))
-        
-        self.pad_canvas_check.setChecked(self.settings.get("downscale/pad_canvas"))
-        self.canvas_multiple_spin.setValue(self.settings.get("downscale/canvas_multiple"))
+        s = self.settings.get_all_downscale_settings()
+        self._settings_writer.mark_clean({f"downscale/{key}": value for key, value in s.items()})
+        
+        with self._loading_values(
+            self.fine_tune_check, self.bg_tolerance_slider, self.edge_tolerance_slider,
+            self.preserve_lines_check, self.dark_threshold_spin, self.auto_trim_check,
+            self.pad_canvas_check, self.canvas_multiple_spin, self.bg_mode_combo,
+        ):
+            for setter, key in (
+                (self.fine_tune_check.setChecked, "enable_fine_tune"),
+                (self.bg_tolerance_slider.setValue, "bg_tolerance"),
+                (self.edge_tolerance_slider.setValue, "bg_edge_tolerance"),
+                (self.preserve_lines_check.setChecked, "preserve_dark_lines"),
+                (self.dark_threshold_spin.setValue, "dark_line_threshold"),
+                (self.auto_trim_check.setChecked, "auto_trim"),
+                (self.pad_canvas_check.setChecked, "pad_canvas"),
+                (self.canvas_multiple_spin.setValue, "canvas_multiple"),
+            ):
+                setter(s[key])
+            
+            mode_index = {"conservative": 0, "aggressive": 1, "none": 2}.get(s["bg_removal_mode"], 0)
+            self.bg_mode_combo.setCurrentIndex(mode_index)
         
+        # Dependent widget state is applied once, after all values are in
         self.update_tolerance_label()
         self.update_edge_tolerance_label()
+        self.on_mode_changed(self.bg_mode_combo.currentIndex())
         self.on_pad_canvas_toggled(self.pad_canvas_check.isChecked())
         
+    @contextmanager
+    def _loading_values(self, *widgets):
+        """Suppress slot side effects while widgets are filled programmatically.
+        
+        Signals of the given widgets are blocked outright; _loading covers
+        anything that still reaches a slot.
+        """
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        self._loading = True
+        try:
+            yield
+        finally:
+            self._loading = False
+            for blocker in blockers:
+                blocker.unblock()
+        
     def load_project_folder(self, project: Project, folder: Path):
         """Load project and folder."""
+        # Pending edits belong to the previous project
+        self.flush_pending_save()
+        
         self.current_project = project
         self.current_folder = folder
+        self._project_writer.reset()
         
-        # Load images
         self.image_list.load_images(folder)
         self.folder_info_label.setText(f"<i>{folder}</i>")
+        self.folder_changed.emit(folder)
         
         # Load project-specific output settings
         if project:
@@ -344,10 +408,24 @@ class DownscaleTab(QWidget):
                 project, "downscale/filename_suffix", ""
             )
             
-            self.output_folder_edit.setText(output_folder)
-            self.use_transform_check.setChecked(use_transform)
-            self.prefix_edit.setText(prefix)
-            self.suffix_edit.setText(suffix)
+            with self._loading_values(
+                self.output_folder_edit, self.use_transform_check, self.prefix_edit, self.suffix_edit
+            ):
+                self.output_folder_edit.setText(output_folder)
+                self.use_transform_check.setChecked(use_transform)
+                self.prefix_edit.setText(prefix)
+                self.suffix_edit.setText(suffix)
+            # textChanged was blocked, so refresh the cached text directly
+            self._output_folder = output_folder
+            self._prefix = prefix
+            self._suffix = suffix
+            
+            self._project_writer.mark_clean({
+                "downscale/output_folder": output_folder,
+                "downscale/use_filename_transform": use_transform,
+                "downscale/filename_prefix": prefix,
+                "downscale/filename_suffix": suffix,
+            })
             
             self.on_use_transform_toggled(use_transform)
         
@@ -369,16 +447,18 @@ class DownscaleTab(QWidget):
             self,
             "Select Folder for AI Downscale Tab",
             start_dir,
-            QFileDialog.Option.ShowDirsOnly
+            directory_options(self.settings)
         )
         
         if folder:
             folder_path = Path(folder)
             self.current_folder = folder_path
             
-            # Reload images
+            # Reload images from a fresh listing
+            clear_cache()
             self.image_list.load_images(folder_path)
             self.folder_info_label.setText(f"<i>{folder_path}</i>")
+            self.folder_changed.emit(folder_path)
             
             # Save this folder for the project
             self.project_manager.set_project_folder(self.current_project, "downscale", folder_path)
@@ -388,36 +468,37 @@ class DownscaleTab(QWidget):
         if self.current_folder:
             self.image_list.load_images_preserve_selection(self.current_folder)
         
-    def save_settings(self):
-        """Save current settings."""
-        self.settings.set("downscale/enable_fine_tune", self.fine_tune_check.isChecked())
-        
+    def current_settings(self) -> dict:
+        """Downscale settings as shown in the widgets, keyed like get_all_downscale_settings()."""
         mode_map = ["conservative", "aggressive", "none"]
-        self.settings.set("downscale/bg_removal_mode", mode_map[self.bg_mode_combo.currentIndex()])
+        return {
+            "enable_fine_tune": self.fine_tune_check.isChecked(),
+            "bg_removal_mode": mode_map[self.bg_mode_combo.currentIndex()],
+            "bg_tolerance": self.bg_tolerance_slider.value(),
+            "bg_edge_tolerance": self.edge_tolerance_slider.value(),
+            "preserve_dark_lines": self.preserve_lines_check.isChecked(),
+            "dark_line_threshold": self.dark_threshold_spin.value(),
+            "auto_trim": self.auto_trim_check.isChecked(),
+            "pad_canvas": self.pad_canvas_check.isChecked(),
+            "canvas_multiple": self.canvas_multiple_spin.value(),
+        }
         
-        self.settings.set("downscale/bg_tolerance", self.bg_tolerance_slider.value())
-        self.settings.set("downscale/bg_edge_tolerance", self.edge_tolerance_slider.value())
-        self.settings.set("downscale/preserve_dark_lines", self.preserve_lines_check.isChecked())
-        self.settings.set("downscale/dark_line_threshold", self.dark_threshold_spin.value())
-        self.settings.set("downscale/auto_trim", self.auto_trim_check.isChecked())
-        
-        self.settings.set("downscale/pad_canvas", self.pad_canvas_check.isChecked())
-        self.settings.set("downscale/canvas_multiple", self.canvas_multiple_spin.value())
+    def save_settings(self):
+        """Save current settings."""
+        self._settings_writer.update({
+            f"downscale/{key}": value for key, value in self.current_settings().items()
+        })
+        self._settings_writer.flush()
         
         # Save project-specific output settings
         if self.current_project:
-            self.project_manager.set_project_setting(
-                self.current_project, "downscale/output_folder", self.output_folder_edit.text()
-            )
-            self.project_manager.set_project_setting(
-                self.current_project, "downscale/use_filename_transform", self.use_transform_check.isChecked()
-            )
-            self.project_manager.set_project_setting(
-                self.current_project, "downscale/filename_prefix", self.prefix_edit.text()
-            )
-            self.project_manager.set_project_setting(
-                self.current_project, "downscale/filename_suffix", self.suffix_edit.text()
-            )
+            self._project_writer.update({
+                "downscale/output_folder": self._output_folder,
+                "downscale/use_filename_transform": self.use_transform_check.isChecked(),
+                "downscale/filename_prefix": self._prefix,
+                "downscale/filename_suffix": self._suffix,
+            })
+            self._project_writer.flush()
         
     @Slot()
     def browse_output_folder(self):
@@ -430,7 +511,7 @@ class DownscaleTab(QWidget):
             self,
             "Select Output Folder",
             str(self.current_folder),
-            QFileDialog.Option.ShowDirsOnly
+            directory_options(self.settings)
         )
         
         if folder:
@@ -440,16 +521,42 @@ class DownscaleTab(QWidget):
                 self.output_folder_edit.setText(str(relative))
             except ValueError:
                 self.output_folder_edit.setText(str(folder_path))
+            # Programmatic setText doesn't emit editingFinished
+            self.on_output_settings_changed()
+        
+    @Slot(str)
+    def on_output_folder_text_changed(self, text):
+        self._output_folder = text
+        
+    @Slot(str)
+    def on_prefix_text_changed(self, text):
+        self._prefix = text
+        
+    @Slot(str)
+    def on_suffix_text_changed(self, text):
+        self._suffix = text
         
     @Slot()
     def on_output_settings_changed(self):
         """Handle output settings change."""
-        if self.current_project:
-            self.save_settings()
+        if self.current_project and not self._loading:
+            self._save_timer.start()
+    
+    def flush_pending_save(self):
+        """Write any pending settings change immediately.
+        
+        Text edits only schedule a save on editingFinished, so a field still
+        being typed in has no timer running; save_settings writes only what
+        differs from storage, making an unconditional save cheap.
+        """
+        self._save_timer.stop()
+        self.save_settings()
         
     @Slot(bool)
     def on_use_transform_toggled(self, checked):
         """Enable/disable prefix/suffix fields."""
+        if self._loading:
+            return
         self.prefix_edit.setEnabled(checked)
         self.suffix_edit.setEnabled(checked)
         
@@ -460,46 +567,54 @@ class DownscaleTab(QWidget):
             QMessageBox.warning(self, "No Folder", "Please select a folder first.")
             return
         
-        output_folder_name = self.output_folder_edit.text().strip() or "downscaled"
+        output_folder_name = self._output_folder.strip() or "downscaled"
         output_dir = self.current_folder / output_folder_name
         
         use_transform = self.use_transform_check.isChecked()
-        prefix = self.prefix_edit.text() if use_transform else ""
-        suffix = self.suffix_edit.text() if use_transform else ""
-        
-        checked_count = 0
-        unchecked_count = 0
-        
-        for i in range(self.image_list.count()):
-            item = self.image_list.item(i)
-            file_path = self.image_list.get_file_path(item)
-            
-            if file_path:
-                stem = file_path.stem
-                expected_name = f"{prefix}{stem}{suffix}.png"
-                expected_path = output_dir / expected_name
-                alt_path = output_dir / f"{stem}.png"
-                
-                if expected_path.exists() or alt_path.exists():
-                    item.setCheckState(Qt.CheckState.Unchecked)
-                    unchecked_count += 1
-                else:
-                    item.setCheckState(Qt.CheckState.Checked)
-                    checked_count += 1
+        prefix = self._prefix if use_transform else ""
+        suffix = self._suffix if use_transform else ""
+        
+        # One directory read instead of two exists() probes per item
+        try:
+            with os.scandir(output_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing = set()
+        
+        # Output names are plain string concatenation on each stem
+        out_suffix = suffix + ".png"
+        splitext = os.path.splitext
+        image_list = self.image_list
+        done = []
+        for i in range(image_list.count()):
+            stem = splitext(image_list.item(i).text())[0]
+            done.append(prefix + stem + out_suffix in existing or stem + ".png" in existing)
+        
+        # Apply every check state in one batch, with a single repaint
+        image_list.set_checked_rows([not is_done for is_done in done])
+        
+        unchecked_count = sum(done)
+        checked_count = len(done) - unchecked_count
         
         msg = f"Smart Select: {checked_count} need processing, {unchecked_count} already done."
         self.window().statusBar().showMessage(msg, 5000)
 
     @Slot()
     def update_tolerance_label(self):
+        if self._loading:
+            return
         self.tolerance_label.setText(str(self.bg_tolerance_slider.value()))
         
     @Slot()
     def update_edge_tolerance_label(self):
+        if self._loading:
+            return
         self.edge_tolerance_label.setText(str(self.edge_tolerance_slider.value()))
         
     @Slot(int)
     def on_mode_changed(self, index):
+        if self._loading:
+            return
         enabled = index != 2
         self.bg_tolerance_slider.setEnabled(enabled)
         self.edge_tolerance_slider.setEnabled(enabled)
@@ -508,6 +623,8 @@ class DownscaleTab(QWidget):
         
     @Slot(bool)
     def on_pad_canvas_toggled(self, checked):
+        if self._loading:
+            return
         self.canvas_multiple_spin.setEnabled(checked)
         
     @Slot()
@@ -523,16 +640,19 @@ class DownscaleTab(QWidget):
             QMessageBox.warning(self, "No Folder", "Please select a folder first.")
             return
             
+        self._save_timer.stop()
         self.save_settings()
         
-        output_folder_name = self.output_folder_edit.text().strip() or "downscaled"
+        output_folder_name = self._output_folder.strip() or "downscaled"
         output_dir = self.current_folder / output_folder_name
         output_dir.mkdir(exist_ok=True)
         
-        settings = self.settings.get_all_downscale_settings()
-        settings['use_filename_transform'] = self.use_transform_check.isChecked()
-        settings['filename_prefix'] = self.prefix_edit.text()
-        settings['filename_suffix'] = self.suffix_edit.text()
+        settings = DownscaleSettings(
+            **self.current_settings(),
+            use_filename_transform=self.use_transform_check.isChecked(),
+            filename_prefix=self._prefix,
+            filename_suffix=self._suffix,
+        )
         
         worker = DownscaleWorker(selected_files, output_dir, settings)
         worker.signals.progress.connect(self.on_progress)
@@ -542,15 +662,27 @@ class DownscaleTab(QWidget):
         self.downscale_btn.setEnabled(False)
         self.downscale_btn.setText("Downscaling...")
         
+        self._progress = self._shown_progress = None
+        self._progress_timer.start()
         self.threadpool.start(worker)
         
     @Slot(tuple)
     def on_progress(self, progress_data):
         current, total, filename = progress_data
-        self.downscale_btn.setText(f"Processing {current}/{total}...")
+        self._progress = (current, total)
+        
+    @Slot()
+    def _flush_progress(self):
+        """Show the latest progress on the button if it moved since the last tick."""
+        progress = self._progress
+        if progress is None or progress == self._shown_progress:
+            return
+        self._shown_progress = progress
+        self.downscale_btn.setText(f"Processing {progress[0]}/{progress[1]}...")
         
     @Slot(list)
     def on_downscale_finished(self, results):
+        self._progress_timer.stop()
         self.downscale_btn.setEnabled(True)
         self.downscale_btn.setText("🔍 Downscale Images")
         
@@ -558,34 +690,39 @@ class DownscaleTab(QWidget):
             QMessageBox.warning(self, "No Results", "No images were successfully downscaled.")
             return
         
-        summary_lines = []
-        for result in results[:5]:
-            name = result.get('filename', 'Unknown')
-            orig_size = result.get('original_size', (0, 0))
-            final_size = result.get('final_size', (0, 0))
-            factor = result.get('scale_factor', 0)
-            
-            summary_lines.append(
-                f"• {name}: {orig_size[0]}×{orig_size[1]} → "
-                f"{final_size[0]}×{final_size[1]} ({factor:.1f}x)"
+        summary = "\n".join(
+            "• {name}: {o[0]}×{o[1]} → {f[0]}×{f[1]} ({factor:.1f}x)".format(
+                name=result.get('filename', 'Unknown'),
+                o=result.get('original_size', (0, 0)),
+                f=result.get('final_size', (0, 0)),
+                factor=result.get('scale_factor', 0),
             )
+            for result in results[:5]
+        )
         
         if len(results) > 5:
-            summary_lines.append(f"... and {len(results) - 5} more")
+            summary += f"\n... and {len(results) - 5} more"
+        output_folder_name = self._output_folder.strip() or "downscaled"
         
-        summary = "\n".join(summary_lines)
-        output_folder_name = self.output_folder_edit.text().strip() or "downscaled"
+        self.window().statusBar().showMessage(f"Downscaled {len(results)} images", 5000)
         
-        QMessageBox.information(
-            self,
+        # Non-modal, so the next batch can be started while the summary is open
+        box = QMessageBox(
+            QMessageBox.Icon.Information,
             "Downscaling Complete",
             f"Successfully downscaled {len(results)} images.\n\n"
             f"{summary}\n\n"
-            f"Output: {self.current_folder / output_folder_name}"
+            f"Output: {self.current_folder / output_folder_name}",
+            QMessageBox.StandardButton.Ok,
+            self
         )
+        box.setWindowModality(Qt.WindowModality.NonModal)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.show()
         
     @Slot(str)
     def on_downscale_error(self, error_msg):
+        self._progress_timer.stop()
         self.downscale_btn.setEnabled(True)
         self.downscale_btn.setText("🔍 Downscale Images")
         QMessageBox.critical(self, "Error", f"An error occurred:\n\n{error_msg}")
\ No newline at end of file
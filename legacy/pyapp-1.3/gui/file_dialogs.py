@@ -0,0 +1,19 @@
+"""
+Options shared by every folder picker in the GUI.
+"""
+from PySide6.QtWidgets import QFileDialog
+
+from core.settings_manager import SettingsManager
+
+
+def directory_options(settings: SettingsManager) -> QFileDialog.Option:
+    """Options for QFileDialog.getExistingDirectory.
+    
+    Qt's own dialog is used unless native dialogs are enabled; the native
+    Windows picker can stall for seconds enumerating shell extensions and
+    network drives before it appears.
+    """
+    options = QFileDialog.Option.ShowDirsOnly
+    if not settings.get("use_native_dialogs"):
+        options |= QFileDialog.Option.DontUseNativeDialog
+    return options
@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -5,12 +6,14 @@ from PySide6.QtWidgets import (
     QStatusBar, QProgressBar, QLabel, QMenu, QInputDialog,
     QToolBar
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QEvent, QFileSystemWatcher, QTimer
 from PySide6.QtGui import QAction
 
 from gui.downscale_tab import DownscaleTab
 from gui.process_tab import ProcessTab
 from gui.pack_tab import PackTab
+from gui.file_dialogs import directory_options
+from gui.widgets.image_list_widget import clear_cache
 from core.settings_manager import SettingsManager
 from core.project_manager import ProjectManager, Project
 
@@ -27,10 +30,10 @@ class MainWindow(QMainWindow):
         self.init_ui()
         self.restore_geometry()
         
-        # Load last project if exists
+        # Load last project once the window has painted
         last_project = self.project_manager.get_current_project()
         if last_project:
-            self.load_project(last_project)
+            QTimer.singleShot(0, lambda: self.load_project(last_project))
         
     def init_ui(self):
         """Initialize the user interface."""
@@ -62,6 +65,18 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.process_tab, "🎨 Post-Process")
         self.tabs.addTab(self.pack_tab, "📦 Pack Sprites")
         
+        # One watcher for every tab's folder; a change drops that folder's cached
+        # listing and rescans the tabs showing it, coalescing bursts
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_folder_changed)
+        self._changed_folders = set()
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(200)
+        self._rescan_timer.timeout.connect(self._refresh_changed_tabs)
+        for tab in (self.downscale_tab, self.process_tab, self.pack_tab):
+            tab.folder_changed.connect(self._watch_tab_folders)
+        
         main_layout.addWidget(self.tabs)
         
         # Create status bar
@@ -94,6 +109,13 @@ class MainWindow(QMainWindow):
         self.projects_btn.clicked.connect(self.show_projects_menu)
         layout.addWidget(self.projects_btn)
         
+        # Built once and repopulated only when the projects list changes
+        self._projects_menu = QMenu(self)
+        self._projects_menu.setToolTipsVisible(True)
+        self._projects_menu.aboutToShow.connect(self._populate_projects_menu)
+        self._projects_menu.installEventFilter(self)
+        self._projects_menu_revision = None
+        
         # Current project label
         layout.addWidget(QLabel("<b>Current Project:</b>"))
         self.current_project_label = QLabel("<i>None</i>")
@@ -129,7 +151,7 @@ class MainWindow(QMainWindow):
             self,
             "Select Project Directory",
             str(Path.home()),
-            QFileDialog.Option.ShowDirsOnly
+            directory_options(self.settings)
         )
         
         if not folder:
@@ -152,26 +174,65 @@ class MainWindow(QMainWindow):
     @Slot()
     def show_projects_menu(self):
         """Show projects dropdown menu."""
-        menu = QMenu(self)
+        # Show menu below button
+        self._projects_menu.exec(self.projects_btn.mapToGlobal(self.projects_btn.rect().bottomLeft()))
+        
+    @Slot()
+    def _populate_projects_menu(self):
+        """Rebuild the projects menu if the projects list changed since it was last built."""
+        if self._projects_menu_revision == self.project_manager.revision:
+            return
+        self._projects_menu_revision = self.project_manager.revision
+        
+        menu = self._projects_menu
+        menu.clear()
         
         projects = self.project_manager.get_projects()
         
         if not projects:
             no_projects = menu.addAction("No projects yet")
             no_projects.setEnabled(False)
-        else:
-            for project in projects:
-                # Create action for this project
-                project_action = menu.addAction(f"📁 {project.name}")
-                project_action.triggered.connect(lambda checked, p=project: self.load_project(p))
-                
-                # Add delete action as sub-menu
-                delete_action = menu.addAction(f"   ✕ Delete")
-                delete_action.triggered.connect(lambda checked, p=project: self.delete_project(p))
-                menu.addSeparator()
+            return
         
-        # Show menu below button
-        menu.exec(self.projects_btn.mapToGlobal(self.projects_btn.rect().bottomLeft()))
+        for project in projects:
+            project_action = menu.addAction(f"📁 {project.name}")
+            project_action.setData(project)
+            project_action.setToolTip("Right-click or press Delete to remove")
+            project_action.triggered.connect(partial(self.load_project, project))
+        
+        menu.addSeparator()
+        menu.addAction("✕ Remove Project...", self.remove_project)
+            
+    def eventFilter(self, obj, event):
+        """Right-click or Delete on a project in the projects menu offers to delete it."""
+        if obj is self._projects_menu:
+            if (event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease)
+                    and event.button() == Qt.MouseButton.RightButton):
+                # QMenu would otherwise trigger (load) the project on right-button release
+                if event.type() == QEvent.Type.MouseButtonRelease:
+                    self._show_project_context_menu(event.position().toPoint())
+                return True
+            if event.type() == QEvent.Type.KeyPress and event.key() == Qt.Key.Key_Delete:
+                action = self._projects_menu.activeAction()
+                project = action.data() if action else None
+                if project is not None:
+                    self._projects_menu.close()
+                    self.delete_project(project)
+                return True
+        return super().eventFilter(obj, event)
+        
+    def _show_project_context_menu(self, pos):
+        """Offer to delete the project at pos in the projects menu."""
+        action = self._projects_menu.actionAt(pos)
+        project = action.data() if action else None
+        if project is None:
+            return
+        
+        context_menu = QMenu(self._projects_menu)
+        delete_action = context_menu.addAction("✕ Delete")
+        if context_menu.exec(self._projects_menu.mapToGlobal(pos)) is delete_action:
+            self._projects_menu.close()
+            self.delete_project(project)
         
     def load_project(self, project: Project):
         """Load a project and its settings."""
@@ -183,32 +244,39 @@ class MainWindow(QMainWindow):
         self.current_project_label.setStyleSheet("color: #333;")
         
         # Load folders for each tab (or default to project path)
-        downscale_folder = self.project_manager.get_project_folder(project, "downscale")
-        process_folder = self.project_manager.get_project_folder(project, "process")
-        pack_folder = self.project_manager.get_project_folder(project, "pack")
-        
-        #print(f"[Project Load] Downscale folder: {downscale_folder}")  # Debug
-        #print(f"[Project Load] Process folder: {process_folder}")      # Debug
-        #print(f"[Project Load] Pack folder: {pack_folder}")            # Debug
+        folders = self.project_manager.get_project_folders(project, ["downscale", "process", "pack"])
         
         # Default to project path if no folder set
-        if not downscale_folder:
-            downscale_folder = project.path
-            self.project_manager.set_project_folder(project, "downscale", project.path)
-        if not process_folder:
-            process_folder = project.path
-            self.project_manager.set_project_folder(project, "process", project.path)
-        if not pack_folder:
-            pack_folder = project.path
-            self.project_manager.set_project_folder(project, "pack", project.path)
-        
-        # Load into tabs
-        self.downscale_tab.load_project_folder(project, downscale_folder)
-        self.process_tab.load_project_folder(project, process_folder)
-        self.pack_tab.load_project_folder(project, pack_folder)
+        missing = {tab_name: project.path for tab_name, folder in folders.items() if not folder}
+        if missing:
+            self.project_manager.set_project_folders(project, missing)
+            folders.update(missing)
+        
+        # Every tab takes the new project now; hidden tabs scan their folder when shown
+        self.downscale_tab.load_project_folder(project, folders["downscale"])
+        self.process_tab.load_project_folder(project, folders["process"])
+        self.pack_tab.load_project_folder(project, folders["pack"])
         
         self.status_bar.showMessage(f"Loaded project: {project.name}", 3000)
         
+    @Slot()
+    def remove_project(self):
+        """Pick a project to remove from the list."""
+        projects = self.project_manager.get_projects()
+        if not projects:
+            QMessageBox.information(self, "Remove Project", "There are no projects to remove.")
+            return
+        
+        names = [f"{project.name}  ({project.path})" for project in projects]
+        current = 0
+        if self.current_project:
+            current = next(
+                (i for i, project in enumerate(projects) if project.path == self.current_project.path), 0
+            )
+        name, ok = QInputDialog.getItem(self, "Remove Project", "Project:", names, current, False)
+        if ok:
+            self.delete_project(projects[names.index(name)])
+        
     def delete_project(self, project: Project):
         """Delete a project."""
         reply = QMessageBox.question(
@@ -236,9 +304,41 @@ class MainWindow(QMainWindow):
         current_tab = self.tabs.currentWidget()
         
         if hasattr(current_tab, 'refresh_files'):
+            # An explicit refresh always rereads the folder
+            if current_tab.current_folder:
+                clear_cache(current_tab.current_folder)
             current_tab.refresh_files()
             self.status_bar.showMessage("File list refreshed", 2000)
         
+    @Slot()
+    def _watch_tab_folders(self):
+        """Watch exactly the folders the tabs are currently showing."""
+        wanted = {
+            str(tab.current_folder)
+            for tab in (self.downscale_tab, self.process_tab, self.pack_tab)
+            if tab.current_folder and tab.current_folder.is_dir()
+        }
+        watched = set(self._fs_watcher.directories())
+        if watched - wanted:
+            self._fs_watcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            self._fs_watcher.addPaths(list(wanted - watched))
+            
+    @Slot(str)
+    def _on_folder_changed(self, path: str):
+        """Invalidate a changed folder's listing and schedule a rescan."""
+        clear_cache(Path(path))
+        self._changed_folders.add(path)
+        self._rescan_timer.start()
+        
+    @Slot()
+    def _refresh_changed_tabs(self):
+        """Rescan the tabs showing a folder that changed on disk."""
+        changed, self._changed_folders = self._changed_folders, set()
+        for tab in (self.downscale_tab, self.process_tab, self.pack_tab):
+            if tab.current_folder and str(tab.current_folder) in changed:
+                tab.refresh_files()
+        
     @Slot(int)
     def on_tab_changed(self, index):
         """Handle tab change - could auto-refresh here."""
@@ -257,6 +357,10 @@ class MainWindow(QMainWindow):
         add_project_action.triggered.connect(self.add_project)
         file_menu.addAction(add_project_action)
         
+        remove_project_action = QAction("&Remove Project...", self)
+        remove_project_action.triggered.connect(self.remove_project)
+        file_menu.addAction(remove_project_action)
+        
         file_menu.addSeparator()
         
         exit_action = QAction("E&xit", self)
@@ -271,6 +375,14 @@ class MainWindow(QMainWindow):
         reset_action.triggered.connect(self.reset_settings)
         settings_menu.addAction(reset_action)
         
+        self.native_dialogs_action = QAction("Use &Native Folder Dialogs", self)
+        self.native_dialogs_action.setCheckable(True)
+        self.native_dialogs_action.setChecked(self.settings.get("use_native_dialogs"))
+        self.native_dialogs_action.toggled.connect(
+            lambda checked: self.settings.set("use_native_dialogs", checked)
+        )
+        settings_menu.addAction(self.native_dialogs_action)
+        
         # Help menu
         help_menu = menubar.addMenu("&Help")
         
@@ -294,12 +406,23 @@ class MainWindow(QMainWindow):
             projects_backup = self.project_manager.get_projects()
             current_backup = self.project_manager.get_current_project()
             
+            # Nothing debounced may land after the clear
+            self.downscale_tab.flush_pending_save()
+            self.process_tab.flush_pending_save()
+            
             self.settings.reset()
             
-            # Restore projects
-            self.project_manager.save_projects(projects_backup)
-            if current_backup:
-                self.project_manager.set_current_project(current_backup)
+            # Restore projects, written together in one flush
+            with self.project_manager.batch():
+                self.project_manager.save_projects(projects_backup)
+                if current_backup:
+                    self.project_manager.set_current_project(current_backup)
+            
+            self.native_dialogs_action.setChecked(self.settings.get("use_native_dialogs"))
+            
+            # Show the defaults, and resync what the tabs believe is stored
+            self.downscale_tab.load_settings()
+            self.process_tab.load_settings()
             
             # Reload tabs
             if self.current_project:
@@ -343,6 +466,10 @@ class MainWindow(QMainWindow):
             
     def closeEvent(self, event):
         """Save settings before closing."""
-        self.settings.set("window_geometry", self.saveGeometry())
-        self.settings.set("window_state", self.saveState())
+        self.downscale_tab.flush_pending_save()
+        self.process_tab.flush_pending_save()
+        self.settings.set_many({
+            "window_geometry": self.saveGeometry(),
+            "window_state": self.saveState(),
+        })
         event.accept()
\ No newline at end of file
@@ -1,12 +1,13 @@
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QLabel, QSpinBox, QCheckBox, QComboBox,
-    QPushButton, QScrollArea, QMessageBox, QFileDialog
+    QPushButton, QMessageBox, QFileDialog
 )
 from PySide6.QtCore import Qt, Signal, Slot, QThreadPool
 
-from gui.widgets.image_list_widget import ImageListWidget
+from gui.file_dialogs import directory_options
+from gui.widgets.image_list_widget import ImageListWidget, clear_cache
 from gui.widgets.color_picker import ColorPickerWidget
 from core.workers import PackWorker
 from core.settings_manager import SettingsManager
@@ -16,11 +17,14 @@ from core.project_manager import ProjectManager, Project
 class PackTab(QWidget):
     """Tab for packing sprites into a sheet."""
     
+    # Emitted with the image folder whenever the tab switches to a new one
+    folder_changed = Signal(object)
+    
     def __init__(self, settings: SettingsManager, project_manager: ProjectManager, parent=None):
         super().__init__(parent)
         self.settings = settings
         self.project_manager = project_manager
-        self.threadpool = QThreadPool()
+        self.threadpool = QThreadPool.globalInstance()
         self.current_folder = None
         self.current_project = None
         
@@ -75,107 +79,87 @@ class PackTab(QWidget):
         
         main_layout.addWidget(left_widget, stretch=2)
         
-        # Right side: Settings (scrollable) + Fixed Button
+        # Right side: Settings + Fixed Button
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
         right_layout.setContentsMargins(0, 0, 0, 0)
         right_layout.setSpacing(10)
         
-        # Scrollable settings area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
         settings_widget = QWidget()
         settings_layout = QVBoxLayout(settings_widget)
+        settings_layout.setContentsMargins(0, 0, 0, 0)
         settings_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         # Layout Settings
         layout_group = QGroupBox("Layout Settings")
-        layout_form = QVBoxLayout()
+        layout_form = QFormLayout()
         
-        width_layout = QHBoxLayout()
-        width_layout.addWidget(QLabel("Max Sheet Width:"))
         self.max_width_spin = QSpinBox()
         self.max_width_spin.setRange(128, 8192)
         self.max_width_spin.setSingleStep(128)
         self.max_width_spin.setSuffix(" px")
         self.max_width_spin.setToolTip("Maximum width before wrapping to next row")
-        width_layout.addWidget(self.max_width_spin)
-        layout_form.addLayout(width_layout)
+        layout_form.addRow("Max Sheet Width:", self.max_width_spin)
         
-        sort_layout = QHBoxLayout()
-        sort_layout.addWidget(QLabel("Sort By:"))
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["Height", "Width", "Name", "None"])
         self.sort_combo.setToolTip("Sorting order for sprite placement")
-        sort_layout.addWidget(self.sort_combo)
-        layout_form.addLayout(sort_layout)
+        layout_form.addRow("Sort By:", self.sort_combo)
         
         layout_group.setLayout(layout_form)
         settings_layout.addWidget(layout_group)
         
         # Spacing Settings
         spacing_group = QGroupBox("Spacing & Padding")
-        spacing_layout = QVBoxLayout()
+        spacing_layout = QFormLayout()
         
-        item_layout = QHBoxLayout()
-        item_layout.addWidget(QLabel("Item Padding:"))
         self.item_padding_spin = QSpinBox()
         self.item_padding_spin.setRange(0, 100)
         self.item_padding_spin.setSuffix(" px")
         self.item_padding_spin.setToolTip("Space between items in the same row")
-        item_layout.addWidget(self.item_padding_spin)
-        spacing_layout.addLayout(item_layout)
+        spacing_layout.addRow("Item Padding:", self.item_padding_spin)
         
-        row_layout = QHBoxLayout()
-        row_layout.addWidget(QLabel("Row Padding:"))
         self.row_padding_spin = QSpinBox()
         self.row_padding_spin.setRange(0, 100)
         self.row_padding_spin.setSuffix(" px")
         self.row_padding_spin.setToolTip("Vertical space between rows")
-        row_layout.addWidget(self.row_padding_spin)
-        spacing_layout.addLayout(row_layout)
+        spacing_layout.addRow("Row Padding:", self.row_padding_spin)
         
-        border_layout = QHBoxLayout()
-        border_layout.addWidget(QLabel("Border Padding:"))
         self.border_padding_spin = QSpinBox()
         self.border_padding_spin.setRange(0, 100)
         self.border_padding_spin.setSuffix(" px")
         self.border_padding_spin.setToolTip("Outer padding around entire sheet")
-        border_layout.addWidget(self.border_padding_spin)
-        spacing_layout.addLayout(border_layout)
+        spacing_layout.addRow("Border Padding:", self.border_padding_spin)
         
         spacing_group.setLayout(spacing_layout)
         settings_layout.addWidget(spacing_group)
         
         # Background Settings
         bg_group = QGroupBox("Background")
-        bg_layout = QVBoxLayout()
+        bg_layout = QFormLayout()
         
-        bg_layout.addWidget(QLabel("Background Color (RGBA):"))
         self.bg_color_picker = ColorPickerWidget((0, 0, 0, 0))
-        bg_layout.addWidget(self.bg_color_picker)
+        bg_layout.addRow(QLabel("Background Color (RGBA):"))
+        bg_layout.addRow(self.bg_color_picker)
         
         bg_group.setLayout(bg_layout)
         settings_layout.addWidget(bg_group)
         
         # Export Settings
         export_group = QGroupBox("Export Options")
-        export_layout = QVBoxLayout()
+        export_layout = QFormLayout()
         
         self.export_metadata_check = QCheckBox("Export JSON Metadata")
         self.export_metadata_check.setChecked(True)
         self.export_metadata_check.setToolTip("Create JSON file with sprite positions")
-        export_layout.addWidget(self.export_metadata_check)
+        export_layout.addRow(self.export_metadata_check)
         
         export_group.setLayout(export_layout)
         settings_layout.addWidget(export_group)
         
-        scroll.setWidget(settings_widget)
-        right_layout.addWidget(scroll, stretch=1)
+        right_layout.addWidget(settings_widget, stretch=1)
         
-        # Fixed button at bottom (outside scroll area)
+        # Fixed button at bottom
         self.pack_btn = QPushButton("📦 Pack Sprites")
         self.pack_btn.setMinimumHeight(45)
         self.pack_btn.setStyleSheet("""
@@ -240,6 +224,7 @@ class PackTab(QWidget):
         self.current_folder = folder
         self.image_list.load_images(folder)
         self.folder_info_label.setText(f"<i>{folder}</i>")
+        self.folder_changed.emit(folder)
         
     @Slot()
     def change_folder(self):
@@ -259,16 +244,18 @@ class PackTab(QWidget):
             self,
             "Select Folder for Pack Sprites Tab",
             start_dir,
-            QFileDialog.Option.ShowDirsOnly
+            directory_options(self.settings)
         )
         
         if folder:
             folder_path = Path(folder)
             self.current_folder = folder_path
             
-            # Reload images
+            # Reload images from a fresh listing
+            clear_cache()
             self.image_list.load_images(folder_path)
             self.folder_info_label.setText(f"<i>{folder_path}</i>")
+            self.folder_changed.emit(folder_path)
             
             # Save this folder for the project with correct tab name
             self.project_manager.set_project_folder(self.current_project, "pack", folder_path)
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
@@ -5,27 +6,51 @@ from PySide6.QtWidgets import (
     QComboBox, QLineEdit, QPushButton, QScrollArea,
     QMessageBox, QFileDialog
 )
-from PySide6.QtCore import Qt, QThreadPool, Slot
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Signal, Slot
 
-from gui.widgets.image_list_widget import ImageListWidget
+from gui.file_dialogs import directory_options
+from gui.widgets.image_list_widget import ImageListWidget, clear_cache
 from gui.widgets.color_picker import ColorPickerWidget
+from core.image_processor import ProcessSettings
 from core.workers import ProcessWorker
-from core.settings_manager import SettingsManager
+from core.settings_manager import SettingsManager, DirtyWriter
 from core.project_manager import ProjectManager, Project
 
 
 class ProcessTab(QWidget):
     """Tab for post-processing images."""
 
+    # Emitted with the image folder whenever the tab switches to a new one
+    folder_changed = Signal(object)
+
     def __init__(self, settings: SettingsManager, project_manager: ProjectManager, parent=None):
         super().__init__(parent)
         self.settings = settings
         self.project_manager = project_manager
-        self.threadpool = QThreadPool()
+        self.threadpool = QThreadPool.globalInstance()
         self.current_folder = None
         self.current_project = None
         self._current_worker = None
 
+        # Coalesce output-setting edits into a single save
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self.save_settings)
+
+        # Button progress text is repainted at most every 100 ms during a run
+        self._progress = None
+        self._shown_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Only keys whose values changed reach storage
+        self._settings_writer = DirtyWriter(self.settings.set)
+        self._project_writer = DirtyWriter(
+            lambda key, value: self.project_manager.set_project_setting(self.current_project, key, value)
+        )
+
         self.init_ui()
         self.load_settings()
 
@@ -101,16 +126,14 @@ class ProcessTab(QWidget):
         output_layout = QVBoxLayout()
         
         # Output folder
-        folder_layout = QHBoxLayout()
-        folder_layout.addWidget(QLabel("Output Folder:"))
         self.output_folder_edit = QLineEdit()
         self.output_folder_edit.setPlaceholderText("processed")
         self.output_folder_edit.textChanged.connect(self.on_output_settings_changed)
-        folder_layout.addWidget(self.output_folder_edit)
         self.browse_output_btn = QPushButton("Browse")
         self.browse_output_btn.clicked.connect(self.browse_output_folder)
-        folder_layout.addWidget(self.browse_output_btn)
-        output_layout.addLayout(folder_layout)
+        output_layout.addLayout(
+            self._row("Output Folder:", self.output_folder_edit, self.browse_output_btn)
+        )
         
         # Filename transform
         self.use_transform_check = QCheckBox("Use Filename Prefix/Suffix")
@@ -120,18 +143,15 @@ class ProcessTab(QWidget):
         output_layout.addWidget(self.use_transform_check)
         
         # Prefix/Suffix
-        transform_layout = QHBoxLayout()
-        transform_layout.addWidget(QLabel("Prefix:"))
         self.prefix_edit = QLineEdit()
         self.prefix_edit.setPlaceholderText("")
         self.prefix_edit.textChanged.connect(self.on_output_settings_changed)
-        transform_layout.addWidget(self.prefix_edit)
-        transform_layout.addWidget(QLabel("Suffix:"))
         self.suffix_edit = QLineEdit()
         self.suffix_edit.setPlaceholderText("")
         self.suffix_edit.textChanged.connect(self.on_output_settings_changed)
-        transform_layout.addWidget(self.suffix_edit)
-        output_layout.addLayout(transform_layout)
+        output_layout.addLayout(
+            self._row("Prefix:", self.prefix_edit, QLabel("Suffix:"), self.suffix_edit)
+        )
         
         output_info = QLabel(
             "<i><small>Smart Select uses these settings to check if files already exist.</small></i>"
@@ -146,25 +166,20 @@ class ProcessTab(QWidget):
         opacity_group = QGroupBox("Opacity Normalization")
         opacity_layout = QVBoxLayout()
 
-        alpha_low_layout = QHBoxLayout()
-        alpha_low_layout.addWidget(QLabel("Low Alpha Cutoff (→ 0):"))
         self.alpha_low_spin = QSpinBox()
         self.alpha_low_spin.setRange(0, 255)
         self.alpha_low_spin.setToolTip("Alpha values below this will be set to 0 (transparent)")
-        alpha_low_layout.addWidget(self.alpha_low_spin)
-        opacity_layout.addLayout(alpha_low_layout)
+        opacity_layout.addLayout(self._row("Low Alpha Cutoff (→ 0):", self.alpha_low_spin))
 
-        alpha_high_layout = QHBoxLayout()
-        alpha_high_layout.addWidget(QLabel("High Alpha Range (→ 255):"))
         self.alpha_high_min_spin = QSpinBox()
         self.alpha_high_min_spin.setRange(0, 255)
         self.alpha_high_min_spin.setSuffix(" - ")
-        alpha_high_layout.addWidget(self.alpha_high_min_spin)
         self.alpha_high_max_spin = QSpinBox()
         self.alpha_high_max_spin.setRange(0, 255)
         self.alpha_high_max_spin.setToolTip("Alpha values in this range will be set to 255 (opaque)")
-        alpha_high_layout.addWidget(self.alpha_high_max_spin)
-        opacity_layout.addLayout(alpha_high_layout)
+        opacity_layout.addLayout(
+            self._row("High Alpha Range (→ 255):", self.alpha_high_min_spin, self.alpha_high_max_spin)
+        )
 
         opacity_group.setLayout(opacity_layout)
         settings_layout.addWidget(opacity_group)
@@ -177,15 +192,12 @@ class ProcessTab(QWidget):
         self.enable_color_check.setToolTip("Merge similar colors to reduce palette size")
         color_layout.addWidget(self.enable_color_check)
 
-        threshold_layout = QHBoxLayout()
-        threshold_layout.addWidget(QLabel("LAB Merge Threshold:"))
         self.lab_threshold_spin = QDoubleSpinBox()
         self.lab_threshold_spin.setRange(0.1, 50.0)
         self.lab_threshold_spin.setSingleStep(0.5)
         self.lab_threshold_spin.setDecimals(1)
         self.lab_threshold_spin.setToolTip("Lower = more similar colors, Higher = fewer merges (3-12 recommended)")
-        threshold_layout.addWidget(self.lab_threshold_spin)
-        color_layout.addLayout(threshold_layout)
+        color_layout.addLayout(self._row("LAB Merge Threshold:", self.lab_threshold_spin))
 
         color_group.setLayout(color_layout)
         settings_layout.addWidget(color_group)
@@ -198,29 +210,20 @@ class ProcessTab(QWidget):
         self.outline_color_picker = ColorPickerWidget()
         outline_layout.addWidget(self.outline_color_picker)
 
-        connectivity_layout = QHBoxLayout()
-        connectivity_layout.addWidget(QLabel("Edge Detection:"))
         self.connectivity_combo = QComboBox()
         self.connectivity_combo.addItems(["4-way (Cardinal)", "8-way (Cardinal + Diagonal)"])
         self.connectivity_combo.setToolTip("4-way: only up/down/left/right, 8-way: includes diagonals")
-        connectivity_layout.addWidget(self.connectivity_combo)
-        outline_layout.addLayout(connectivity_layout)
+        outline_layout.addLayout(self._row("Edge Detection:", self.connectivity_combo))
 
-        thickness_layout = QHBoxLayout()
-        thickness_layout.addWidget(QLabel("Outline Thickness:"))
         self.thickness_spin = QSpinBox()
         self.thickness_spin.setRange(1, 10)
         self.thickness_spin.setToolTip("Thickness in pixels (1 = single pixel outline)")
-        thickness_layout.addWidget(self.thickness_spin)
-        outline_layout.addLayout(thickness_layout)
+        outline_layout.addLayout(self._row("Outline Thickness:", self.thickness_spin))
 
-        edge_layout = QHBoxLayout()
-        edge_layout.addWidget(QLabel("Transparent Cutoff:"))
         self.edge_cutoff_spin = QSpinBox()
         self.edge_cutoff_spin.setRange(0, 255)
         self.edge_cutoff_spin.setToolTip("Alpha values <= this are considered transparent for outline")
-        edge_layout.addWidget(self.edge_cutoff_spin)
-        outline_layout.addLayout(edge_layout)
+        outline_layout.addLayout(self._row("Transparent Cutoff:", self.edge_cutoff_spin))
 
         outline_group.setLayout(outline_layout)
         settings_layout.addWidget(outline_group)
@@ -229,13 +232,10 @@ class ProcessTab(QWidget):
         filename_group = QGroupBox("Filename Processing")
         filename_layout = QVBoxLayout()
 
-        prefix_layout = QHBoxLayout()
-        prefix_layout.addWidget(QLabel("Strip Prefix:"))
         self.strip_prefix_edit = QLineEdit()
         self.strip_prefix_edit.setPlaceholderText("e.g., sprite_")
         self.strip_prefix_edit.setToolTip("Prefix to remove from filenames")
-        prefix_layout.addWidget(self.strip_prefix_edit)
-        filename_layout.addLayout(prefix_layout)
+        filename_layout.addLayout(self._row("Strip Prefix:", self.strip_prefix_edit))
 
         filename_group.setLayout(filename_layout)
         settings_layout.addWidget(filename_group)
@@ -266,6 +266,15 @@ class ProcessTab(QWidget):
 
         main_layout.addWidget(right_widget, stretch=1)
 
+    @staticmethod
+    def _row(label: str, *widgets: QWidget) -> QHBoxLayout:
+        """Build a settings row: a label followed by its widgets."""
+        row = QHBoxLayout()
+        row.addWidget(QLabel(label))
+        for widget in widgets:
+            row.addWidget(widget)
+        return row
+
     @Slot()
     def toggle_view_mode(self):
         """Toggle between thumbnail and list view."""
@@ -279,28 +288,46 @@ class ProcessTab(QWidget):
 
     def load_settings(self):
         """Load global settings."""
-        self.alpha_low_spin.setValue(self.settings.get("process/alpha_low_cutoff"))
-        self.alpha_high_min_spin.setValue(self.settings.get("process/alpha_high_min"))
-        self.alpha_high_max_spin.setValue(self.settings.get("process/alpha_high_max"))
-        self.enable_color_check.setChecked(self.settings.get("process/enable_color_simplify"))
-        self.lab_threshold_spin.setValue(self.settings.get("process/lab_merge_threshold"))
-        self.outline_color_picker.set_color(self.settings.get("process/outline_color"))
-        self.edge_cutoff_spin.setValue(self.settings.get("process/edge_transparent_cutoff"))
-
-        connectivity = self.settings.get("process/outline_connectivity")
+        s = self.settings.get_many([
+            "process/alpha_low_cutoff",
+            "process/alpha_high_min",
+            "process/alpha_high_max",
+            "process/enable_color_simplify",
+            "process/lab_merge_threshold",
+            "process/outline_color",
+            "process/edge_transparent_cutoff",
+            "process/outline_connectivity",
+            "process/outline_thickness",
+            "process/prefix_to_strip",
+        ])
+        self._settings_writer.mark_clean(s)
+        self.alpha_low_spin.setValue(s["process/alpha_low_cutoff"])
+        self.alpha_high_min_spin.setValue(s["process/alpha_high_min"])
+        self.alpha_high_max_spin.setValue(s["process/alpha_high_max"])
+        self.enable_color_check.setChecked(s["process/enable_color_simplify"])
+        self.lab_threshold_spin.setValue(s["process/lab_merge_threshold"])
+        self.outline_color_picker.set_color(s["process/outline_color"])
+        self.edge_cutoff_spin.setValue(s["process/edge_transparent_cutoff"])
+
+        connectivity = s["process/outline_connectivity"]
         self.connectivity_combo.setCurrentIndex(0 if connectivity == 4 else 1)
 
-        self.thickness_spin.setValue(self.settings.get("process/outline_thickness"))
-        self.strip_prefix_edit.setText(self.settings.get("process/prefix_to_strip"))
+        self.thickness_spin.setValue(s["process/outline_thickness"])
+        self.strip_prefix_edit.setText(s["process/prefix_to_strip"])
 
     def load_project_folder(self, project: Project, folder: Path):
         """Load project and folder."""
+        # Pending edits belong to the previous project
+        self.flush_pending_save()
+        
         self.current_project = project
         self.current_folder = folder
+        self._project_writer.reset()
         
         # Load images
         self.image_list.load_images(folder)
         self.folder_info_label.setText(f"<i>{folder}</i>")
+        self.folder_changed.emit(folder)
         
         # Load project-specific output settings
         if project:
@@ -322,6 +349,13 @@ class ProcessTab(QWidget):
             self.prefix_edit.setText(prefix)
             self.suffix_edit.setText(suffix)
             
+            self._project_writer.mark_clean({
+                "process/output_folder": output_folder,
+                "process/use_filename_transform": use_transform,
+                "process/filename_prefix": prefix,
+                "process/filename_suffix": suffix,
+            })
+            
             self.on_use_transform_toggled(use_transform)
 
     @Slot()
@@ -342,16 +376,18 @@ class ProcessTab(QWidget):
             self,
             "Select Folder for Post-Process Tab",
             start_dir,
-            QFileDialog.Option.ShowDirsOnly
+            directory_options(self.settings)
         )
         
         if folder:
             folder_path = Path(folder)
             self.current_folder = folder_path
             
-            # Reload images
+            # Reload images from a fresh listing
+            clear_cache()
             self.image_list.load_images(folder_path)
             self.folder_info_label.setText(f"<i>{folder_path}</i>")
+            self.folder_changed.emit(folder_path)
             
             # Save this folder for the project
             self.project_manager.set_project_folder(self.current_project, "process", folder_path)
@@ -363,34 +399,30 @@ class ProcessTab(QWidget):
 
     def save_settings(self):
         """Save current settings."""
-        self.settings.set("process/alpha_low_cutoff", self.alpha_low_spin.value())
-        self.settings.set("process/alpha_high_min", self.alpha_high_min_spin.value())
-        self.settings.set("process/alpha_high_max", self.alpha_high_max_spin.value())
-        self.settings.set("process/enable_color_simplify", self.enable_color_check.isChecked())
-        self.settings.set("process/lab_merge_threshold", self.lab_threshold_spin.value())
-        self.settings.set("process/outline_color", self.outline_color_picker.get_color())
-        self.settings.set("process/edge_transparent_cutoff", self.edge_cutoff_spin.value())
-
         connectivity = 4 if self.connectivity_combo.currentIndex() == 0 else 8
-        self.settings.set("process/outline_connectivity", connectivity)
-
-        self.settings.set("process/outline_thickness", self.thickness_spin.value())
-        self.settings.set("process/prefix_to_strip", self.strip_prefix_edit.text())
+        self._settings_writer.update({
+            "process/alpha_low_cutoff": self.alpha_low_spin.value(),
+            "process/alpha_high_min": self.alpha_high_min_spin.value(),
+            "process/alpha_high_max": self.alpha_high_max_spin.value(),
+            "process/enable_color_simplify": self.enable_color_check.isChecked(),
+            "process/lab_merge_threshold": self.lab_threshold_spin.value(),
+            "process/outline_color": self.outline_color_picker.get_color(),
+            "process/edge_transparent_cutoff": self.edge_cutoff_spin.value(),
+            "process/outline_connectivity": connectivity,
+            "process/outline_thickness": self.thickness_spin.value(),
+            "process/prefix_to_strip": self.strip_prefix_edit.text(),
+        })
+        self._settings_writer.flush()
         
         # Save project-specific output settings
         if self.current_project:
-            self.project_manager.set_project_setting(
-                self.current_project, "process/output_folder", self.output_folder_edit.text()
-            )
-            self.project_manager.set_project_setting(
-                self.current_project, "process/use_filename_transform", self.use_transform_check.isChecked()
-            )
-            self.project_manager.set_project_setting(
-                self.current_project, "process/filename_prefix", self.prefix_edit.text()
-            )
-            self.project_manager.set_project_setting(
-                self.current_project, "process/filename_suffix", self.suffix_edit.text()
-            )
+            self._project_writer.update({
+                "process/output_folder": self.output_folder_edit.text(),
+                "process/use_filename_transform": self.use_transform_check.isChecked(),
+                "process/filename_prefix": self.prefix_edit.text(),
+                "process/filename_suffix": self.suffix_edit.text(),
+            })
+            self._project_writer.flush()
 
     @Slot()
     def browse_output_folder(self):
@@ -403,7 +435,7 @@ class ProcessTab(QWidget):
             self,
             "Select Output Folder",
             str(self.current_folder),
-            QFileDialog.Option.ShowDirsOnly
+            directory_options(self.settings)
         )
         
         if folder:
@@ -418,6 +450,12 @@ class ProcessTab(QWidget):
     def on_output_settings_changed(self):
         """Handle output settings change."""
         if self.current_project:
+            self._save_timer.start()
+    
+    def flush_pending_save(self):
+        """Write any debounced settings change immediately."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
             self.save_settings()
     
     @Slot(bool)
@@ -440,25 +478,31 @@ class ProcessTab(QWidget):
         prefix = self.prefix_edit.text() if use_transform else ""
         suffix = self.suffix_edit.text() if use_transform else ""
         
-        checked_count = 0
-        unchecked_count = 0
+        # One directory read instead of two exists() probes per item
+        try:
+            with os.scandir(output_dir) as it:
+                existing = {entry.name for entry in it}
+        except FileNotFoundError:
+            existing = set()
         
-        for i in range(self.image_list.count()):
-            item = self.image_list.item(i)
-            file_path = self.image_list.get_file_path(item)
-            
-            if file_path:
-                stem = file_path.stem
-                expected_name = f"{prefix}{stem}{suffix}.png"
-                expected_path = output_dir / expected_name
-                alt_path = output_dir / f"{stem}.png"
-                
-                if expected_path.exists() or alt_path.exists():
-                    item.setCheckState(Qt.CheckState.Unchecked)
-                    unchecked_count += 1
-                else:
-                    item.setCheckState(Qt.CheckState.Checked)
-                    checked_count += 1
+        # Without a transform the plain name is the expected name
+        check_plain = bool(prefix or suffix)
+        
+        image_list = self.image_list
+        stems = [image_list.get_file_path(image_list.item(i)).stem for i in range(image_list.count())]
+        
+        # Decide every item in one pass, then touch the widgets
+        done = [
+            f"{prefix}{stem}{suffix}.png" in existing
+            or (check_plain and f"{stem}.png" in existing)
+            for stem in stems
+        ]
+        
+        # Apply every check state in one batch, with a single repaint
+        image_list.set_checked_rows([not is_done for is_done in done])
+        
+        unchecked_count = sum(done)
+        checked_count = len(done) - unchecked_count
         
         msg = f"Smart Select: {checked_count} need processing, {unchecked_count} already done."
         self.window().statusBar().showMessage(msg, 5000)
@@ -475,27 +519,28 @@ class ProcessTab(QWidget):
             QMessageBox.warning(self, "No Folder", "Please select a folder first.")
             return
 
+        self._save_timer.stop()
         self.save_settings()
 
         output_folder_name = self.output_folder_edit.text().strip() or "processed"
         output_dir = self.current_folder / output_folder_name
         output_dir.mkdir(exist_ok=True)
 
-        settings = {
-            "alpha_low_cutoff": self.alpha_low_spin.value(),
-            "alpha_high_min": self.alpha_high_min_spin.value(),
-            "alpha_high_max": self.alpha_high_max_spin.value(),
-            "enable_color_simplify": self.enable_color_check.isChecked(),
-            "lab_merge_threshold": self.lab_threshold_spin.value(),
-            "outline_color": self.outline_color_picker.get_color(),
-            "edge_cutoff": self.edge_cutoff_spin.value(),
-            "connectivity": 4 if self.connectivity_combo.currentIndex() == 0 else 8,
-            "thickness": self.thickness_spin.value(),
-            "prefix_to_strip": self.strip_prefix_edit.text(),
-            "use_filename_transform": self.use_transform_check.isChecked(),
-            "filename_prefix": self.prefix_edit.text(),
-            "filename_suffix": self.suffix_edit.text(),
-        }
+        settings = ProcessSettings(
+            alpha_low_cutoff=self.alpha_low_spin.value(),
+            alpha_high_min=self.alpha_high_min_spin.value(),
+            alpha_high_max=self.alpha_high_max_spin.value(),
+            enable_color_simplify=self.enable_color_check.isChecked(),
+            lab_merge_threshold=self.lab_threshold_spin.value(),
+            outline_color=tuple(self.outline_color_picker.get_color()),
+            edge_cutoff=self.edge_cutoff_spin.value(),
+            connectivity=4 if self.connectivity_combo.currentIndex() == 0 else 8,
+            thickness=self.thickness_spin.value(),
+            prefix_to_strip=self.strip_prefix_edit.text(),
+            use_filename_transform=self.use_transform_check.isChecked(),
+            filename_prefix=self.prefix_edit.text(),
+            filename_suffix=self.suffix_edit.text(),
+        )
 
         worker = ProcessWorker(selected_files, output_dir, settings)
         self._current_worker = worker
@@ -506,6 +551,8 @@ class ProcessTab(QWidget):
 
         self.process_btn.setEnabled(False)
         self.process_btn.setText("Processing...")
+        self._progress = self._shown_progress = None
+        self._progress_timer.start()
 
         self.threadpool.start(worker)
 
@@ -513,29 +560,34 @@ class ProcessTab(QWidget):
         if not args:
             return
 
+        # Workers emit (current, total, filename) as a single object
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+
+        # Only remember the latest text; _flush_progress shows it
         if len(args) == 1:
             try:
                 percent = int(args[0])
             except Exception:
                 return
             percent = max(0, min(100, percent))
-            self.process_btn.setText(f"Processing… {percent}%")
+            self._progress = f"Processing… {percent}%"
             return
 
         current, total = args[0], args[1]
-        filename = args[2] if len(args) > 2 else None
-        try:
-            percent = int((current / total) * 100) if total else 0
-        except Exception:
-            percent = 0
-        percent = max(0, min(100, percent))
+        self._progress = f"Processing {current}/{total}…"
 
-        label = f"Processing {current}/{total}…"
-        if filename:
-            label = f"Processing {current}/{total}…"
-        self.process_btn.setText(label)
+    @Slot()
+    def _flush_progress(self):
+        """Show the latest progress on the button if it changed since the last tick."""
+        progress = self._progress
+        if progress is None or progress == self._shown_progress:
+            return
+        self._shown_progress = progress
+        self.process_btn.setText(progress)
 
     def on_process_finished(self, *args):
+        self._progress_timer.stop()
         self.process_btn.setEnabled(True)
         self.process_btn.setText("🚀 Process Images")
 
@@ -558,6 +610,7 @@ class ProcessTab(QWidget):
         self._current_worker = None
 
     def on_process_error(self, error_msg):
+        self._progress_timer.stop()
         self.process_btn.setEnabled(True)
         self.process_btn.setText("🚀 Process Images")
         QMessageBox.critical(self, "Processing Error", f"An error occurred:\n\n{error_msg}")
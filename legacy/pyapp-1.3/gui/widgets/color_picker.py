@@ -1,8 +1,8 @@
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QSpinBox, QLabel, QColorDialog
 )
-from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Signal, Qt, QSize
+from PySide6.QtGui import QColor, QIcon, QPixmap
 
 
 class ColorPickerWidget(QWidget):
@@ -12,7 +12,7 @@ class ColorPickerWidget(QWidget):
     
     def __init__(self, initial_color=(255, 255, 255, 255), parent=None):
         super().__init__(parent)
-        self._color = initial_color
+        self._color = None  # Filled in by set_color() below
         self.init_ui()
         self.set_color(initial_color)
         
@@ -22,11 +22,13 @@ class ColorPickerWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(5)
         
-        # Color preview button
+        # Color preview button; the swatch is an icon so updates don't touch the stylesheet
         self.color_button = QPushButton()
         self.color_button.setFixedSize(50, 30)
         self.color_button.clicked.connect(self.open_color_dialog)
         self.color_button.setStyleSheet("QPushButton { border: 2px solid #555; }")
+        self.color_button.setIconSize(QSize(46, 26))
+        self._swatch = QPixmap(self.color_button.iconSize())
         layout.addWidget(self.color_button)
         
         # RGBA spinboxes
@@ -59,16 +61,23 @@ class ColorPickerWidget(QWidget):
         """Set the current color (r, g, b, a)."""
         if len(color) == 3:
             color = (*color, 255)
+        color = tuple(color)
+        if color == self._color:
+            return
             
         self._color = color
         r, g, b, a = color
         
-        # Block signals to avoid recursion
-        for spin, val in zip([self.spin_r, self.spin_g, self.spin_b, self.spin_a],
-                            [r, g, b, a]):
+        # Block signals to avoid recursion, once around all four updates
+        spins = (self.spin_r, self.spin_g, self.spin_b, self.spin_a)
+        for spin in spins:
             spin.blockSignals(True)
-            spin.setValue(val)
-            spin.blockSignals(False)
+        try:
+            for spin, val in zip(spins, (r, g, b, a)):
+                spin.setValue(val)
+        finally:
+            for spin in spins:
+                spin.blockSignals(False)
             
         # Update button color
         self.update_button_color()
@@ -79,11 +88,8 @@ class ColorPickerWidget(QWidget):
         
     def update_button_color(self):
         """Update the color preview button."""
-        r, g, b, a = self._color
-        self.color_button.setStyleSheet(
-            f"QPushButton {{ background-color: rgba({r}, {g}, {b}, {a}); "
-            f"border: 2px solid #555; }}"
-        )
+        self._swatch.fill(QColor(*self._color))
+        self.color_button.setIcon(QIcon(self._swatch))
         
     def on_spinbox_changed(self):
         """Handle spinbox value changes."""
@@ -110,5 +116,6 @@ class ColorPickerWidget(QWidget):
         
         if color.isValid():
             rgba = (color.red(), color.green(), color.blue(), color.alpha())
-            self.set_color(rgba)
-            self.colorChanged.emit(self._color)
\ No newline at end of file
+            if rgba != self._color:
+                self.set_color(rgba)
+                self.colorChanged.emit(self._color)
\ No newline at end of file
@@ -1,14 +1,187 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from PySide6.QtWidgets import QListWidget, QListWidgetItem
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import (
+    Qt, QSize, QObject, QRunnable, QThreadPool, QStandardPaths, Signal, Slot
+)
+from PySide6.QtGui import QIcon, QImage, QPixmap, QPixmapCache
+
+from core.directory_cache import DirectoryListingCache
+
+THUMBNAIL_SIZE = 64
+
+# Memory budget for decoded thumbnails in Qt's process-wide QPixmapCache
+PIXMAP_CACHE_LIMIT_KB = 100 * 1024
+
+# On-disk thumbnail cache limits, enforced by ThumbnailCachePruner at startup
+THUMB_CACHE_MAX_AGE_DAYS = 30
+THUMB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _pixmap_cache_key(key: Tuple[str, int, int]) -> str:
+    """QPixmapCache key for a (path, mtime_ns, size) thumbnail key."""
+    return f"{key[0]}:{key[1]}:{key[2]}:{THUMBNAIL_SIZE}"
+
+# Thumbnail keys put in QPixmapCache (which may have evicted some since); lets
+# loaders skip decoding without touching QPixmapCache off the GUI thread
+_pixmap_cached_keys: Set[Tuple[str, int, int]] = set()
+
+# Image listings shared by every list widget
+_listing_cache = DirectoryListingCache({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'})
+
+
+def clear_cache(folder: Optional[Path] = None):
+    """Forget the cached listing for folder, or all cached listings."""
+    _listing_cache.invalidate(folder)
+
+
+def _thumb_cache_dir() -> Path:
+    """Directory holding the on-disk thumbnail cache."""
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    return Path(base) / "thumbs"
+
+
+def _thumb_cache_path(cache_dir: Path, key: Tuple[str, int, int]) -> Path:
+    """Cached thumbnail file for a (path, mtime_ns, size) key.
+    
+    The key includes mtime and size, so edited files get a new entry automatically.
+    """
+    digest = blake2b(repr(key).encode("utf-8")).hexdigest()[:24]
+    return cache_dir / f"{digest}.png"
+
+
+def _save_thumb(image: QImage, cached: Path):
+    """Write a cached thumbnail atomically, so concurrent loaders never see a partial file."""
+    tmp = cached.with_name(f"{cached.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        if image.save(str(tmp), "PNG"):
+            os.replace(tmp, cached)
+    except OSError:
+        pass
+    finally:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+class ThumbnailCachePruner(QRunnable):
+    """Trims the on-disk thumbnail cache in a background thread.
+    
+    Cache keys include mtime and size, so every edit leaves an old entry
+    behind. Entries older than THUMB_CACHE_MAX_AGE_DAYS go first, then the
+    oldest until the cache fits in THUMB_CACHE_MAX_BYTES.
+    """
+    
+    @Slot()
+    def run(self):
+        """Delete stale and excess cache files."""
+        cache_dir = _thumb_cache_dir()
+        try:
+            with os.scandir(cache_dir) as it:
+                entries = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in it if e.is_file()]
+        except OSError:
+            return
+        
+        cutoff = time.time() - THUMB_CACHE_MAX_AGE_DAYS * 86400
+        total = sum(size for _, size, _ in entries)
+        # Newest last, so the oldest entries are removed first
+        entries.sort()
+        for mtime, size, path in entries:
+            if mtime >= cutoff and total <= THUMB_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+class ThumbnailSignals(QObject):
+    """Signals for the thumbnail loader."""
+    loaded = Signal(object)  # (generation, row, cache_key, QImage or None if already cached)
+
+
+class ThumbnailLoader(QRunnable):
+    """Stats and decodes thumbnails for a batch of list rows in a background thread."""
+    
+    def __init__(self, generation: int, jobs: List[Tuple[int, str]], signals: ThumbnailSignals):
+        super().__init__()
+        self.generation = generation
+        self.jobs = jobs
+        self.cancelled = False
+        # Owned by the list widget so it outlives superseded loaders
+        self.signals = signals
+        
+    @Slot()
+    def run(self):
+        """Decode and scale each image, emitting results as they complete."""
+        cache_dir = _thumb_cache_dir()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            cache_dir = None
+        
+        for row, file_path in self.jobs:
+            if self.cancelled:
+                return
+            
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            key = (file_path, st.st_mtime_ns, st.st_size)
+            
+            if key in _pixmap_cached_keys:
+                # The widget takes it from QPixmapCache (or asks again if evicted)
+                image = None
+            else:
+                image = self._decode(key, cache_dir)
+                if image is None:
+                    continue
+            if not self._emit(row, key, image):
+                return
+    
+    @staticmethod
+    def _decode(key: Tuple[str, int, int], cache_dir: Optional[Path]) -> Optional[QImage]:
+        """Thumbnail for key from the on-disk cache, or decoded and scaled from the file."""
+        # Small cached PNG from a previous session, if any
+        cached = _thumb_cache_path(cache_dir, key) if cache_dir else None
+        if cached is not None and cached.exists():
+            image = QImage(str(cached))
+            if not image.isNull():
+                return image
+        
+        image = QImage(key[0])
+        if image.isNull():
+            return None
+        image = image.scaled(
+            THUMBNAIL_SIZE, THUMBNAIL_SIZE,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        if cached is not None:
+            _save_thumb(image, cached)
+        return image
+    
+    def _emit(self, row, key, image) -> bool:
+        """Hand a thumbnail to the widget; False once the widget is gone."""
+        try:
+            self.signals.loaded.emit((self.generation, row, key, image))
+        except RuntimeError:
+            return False
+        return True
 
 
 class ImageListWidget(QListWidget):
     """Custom list widget for displaying and selecting images."""
     
-    SUPPORTED_FORMATS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'}
+    SUPPORTED_FORMATS = _listing_cache.extensions
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -19,6 +192,19 @@ class ImageListWidget(QListWidget):
         self.setMovement(QListWidget.Movement.Static)
         self.setWrapping(True)
         
+        # Folder to scan once the widget is shown: (folder, keep_checked)
+        self._deferred: Optional[Tuple[Path, Optional[Set[Path]]]] = None
+        
+        self._thumb_generation = 0
+        self._thumb_loader: Optional[ThumbnailLoader] = None
+        self._thumb_signals = ThumbnailSignals(self)
+        self._thumb_signals.loaded.connect(self._on_thumbnail_loaded)
+        
+        # Checked item paths, kept in sync via itemChanged
+        self._checked: Set[Path] = set()
+        self._rows: Dict[Path, int] = {}
+        self.itemChanged.connect(self._on_item_changed)
+        
     def set_view_mode(self, thumbnail_mode: bool):
         """Switch between thumbnail and list view."""
         if thumbnail_mode:
@@ -32,106 +218,199 @@ class ImageListWidget(QListWidget):
             self.setSpacing(2)
             self.setWrapping(False)
         
+    @contextmanager
+    def _bulk_update(self):
+        """Suspend repaints and sorting while many items are changed."""
+        sorting = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+        try:
+            yield
+        finally:
+            self.setSortingEnabled(sorting)
+            self.setUpdatesEnabled(True)
+        
     def load_images(self, folder: Path):
         """Load images from folder."""
-        self.clear()
-        
-        if not folder.exists():
-            return
-        
-        # Get all image files
-        image_files = []
-        for fmt in self.SUPPORTED_FORMATS:
-            image_files.extend(folder.glob(f"*{fmt}"))
-        
-        # Sort by name
-        image_files.sort(key=lambda p: p.name.lower())
-        
-        # Add to list
-        for file_path in image_files:
-            item = QListWidgetItem(file_path.name)
-            item.setCheckState(Qt.CheckState.Checked)
-            item.setData(Qt.ItemDataRole.UserRole, str(file_path))
-            
-            # Try to set thumbnail
-            try:
-                icon = QIcon(str(file_path))
-                if not icon.isNull():
-                    item.setIcon(icon)
-            except Exception:
-                pass
-            
-            self.addItem(item)
+        self._populate_when_visible(folder, None)
     
     def load_images_preserve_selection(self, folder: Path):
         """Load images from folder while preserving check states."""
-        # Save current check states
-        checked_names = set()
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                checked_names.add(item.text())
-        
-        # Clear and reload
+        if self._deferred is not None:
+            # Not scanned yet; keep what the pending scan would have kept
+            keep_checked = self._deferred[1]
+        else:
+            # Identity is the stored Path, so same-named files elsewhere can't collide
+            keep_checked = set(self._checked)
+        self._populate_when_visible(folder, keep_checked)
+    
+    def _populate_when_visible(self, folder: Path, keep_checked: Optional[Set[Path]]):
+        """Rebuild the list now if it is on screen, otherwise when it is next shown.
+        
+        Hidden tabs then cost nothing when a project loads or their folder changes.
+        """
+        if self.isVisible():
+            self._deferred = None
+            self._populate(folder, keep_checked)
+        else:
+            self.clear()
+            self._deferred = (folder, keep_checked)
+    
+    def showEvent(self, event):
+        """Scan a folder whose listing was deferred while hidden."""
+        super().showEvent(event)
+        if self._deferred is not None:
+            folder, keep_checked = self._deferred
+            self._deferred = None
+            self._populate(folder, keep_checked)
+    
+    def _populate(self, folder: Path, keep_checked: Optional[Set[Path]]):
+        """Rebuild the list from folder.
+        
+        Every file is checked when keep_checked is None; otherwise only
+        files whose path is in keep_checked.
+        """
         self.clear()
         
-        if not folder.exists():
+        # A missing folder surfaces from the listing itself; no separate exists() probe
+        try:
+            names = _listing_cache.list_files(folder)
+        except FileNotFoundError:
             return
         
-        # Get all image files
-        image_files = []
-        for fmt in self.SUPPORTED_FORMATS:
-            image_files.extend(folder.glob(f"*{fmt}"))
+        # Add to list
+        pending = []
+        with self._bulk_update():
+            for row, name in enumerate(names):
+                file_path = folder / name
+                checked = keep_checked is None or file_path in keep_checked
+                
+                item = QListWidgetItem(name)
+                if checked:
+                    item.setCheckState(Qt.CheckState.Checked)
+                else:
+                    item.setCheckState(Qt.CheckState.Unchecked)
+                item.setData(Qt.ItemDataRole.UserRole, file_path)
+                
+                self.addItem(item)
+                self._rows[file_path] = row
+                if checked:
+                    self._checked.add(file_path)
+                pending.append((row, str(file_path)))
         
-        # Sort by name
-        image_files.sort(key=lambda p: p.name.lower())
+        # Thumbnails are decoded off the UI thread
+        self._load_thumbnails(pending)
+    
+    def _load_thumbnails(self, pending):
+        """Queue (row, path) pairs for background stat and decoding."""
+        # Drop results from any loader still working on a previous listing
+        if self._thumb_loader is not None:
+            self._thumb_loader.cancelled = True
+            self._thumb_loader = None
+        self._thumb_generation += 1
         
-        # Add to list with preserved check state
-        for file_path in image_files:
-            item = QListWidgetItem(file_path.name)
-            
-            # Restore check state if it was checked before
-            if file_path.name in checked_names:
-                item.setCheckState(Qt.CheckState.Checked)
-            else:
-                item.setCheckState(Qt.CheckState.Unchecked)
-            
-            item.setData(Qt.ItemDataRole.UserRole, str(file_path))
-            
-            # Try to set thumbnail
-            try:
-                icon = QIcon(str(file_path))
-                if not icon.isNull():
-                    item.setIcon(icon)
-            except Exception:
-                pass
-            
-            self.addItem(item)
+        if pending:
+            self._thumb_loader = self._start_thumbnail_loader(pending)
+    
+    def _start_thumbnail_loader(self, jobs) -> ThumbnailLoader:
+        """Start a loader for jobs in the current generation."""
+        loader = ThumbnailLoader(self._thumb_generation, jobs, self._thumb_signals)
+        QThreadPool.globalInstance().start(loader)
+        return loader
+    
+    @Slot(object)
+    def _on_thumbnail_loaded(self, result):
+        """Set a thumbnail on its row (GUI thread)."""
+        generation, row, key, image = result
+        cache_key = _pixmap_cache_key(key)
+        if image is None:
+            pixmap = QPixmap()
+            if not QPixmapCache.find(cache_key, pixmap):
+                # Evicted since the loader checked; decode it again
+                _pixmap_cached_keys.discard(key)
+                if generation == self._thumb_generation:
+                    self._start_thumbnail_loader([(row, key[0])])
+                return
+        else:
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(cache_key, pixmap)
+            _pixmap_cached_keys.add(key)
+        if generation != self._thumb_generation:
+            return
+        item = self.item(row)
+        if item is not None:
+            item.setIcon(QIcon(pixmap))
+    
+    def clear(self):
+        """Remove all items and reset the checked set."""
+        super().clear()
+        self._checked.clear()
+        self._rows.clear()
+    
+    @Slot(QListWidgetItem)
+    def _on_item_changed(self, item: QListWidgetItem):
+        """Track check-state changes in the checked set."""
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        if not file_path:
+            return
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked.add(file_path)
+        else:
+            self._checked.discard(file_path)
     
     def get_selected_files(self) -> List[Path]:
-        """Get list of checked file paths."""
-        selected = []
-        for i in range(self.count()):
-            item = self.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                file_path = item.data(Qt.ItemDataRole.UserRole)
-                if file_path:
-                    selected.append(Path(file_path))
-        return selected
+        """Get list of checked file paths, in list order."""
+        rows = self._rows
+        return sorted(self._checked, key=rows.__getitem__)
     
     def get_file_path(self, item: QListWidgetItem) -> Optional[Path]:
         """Get file path from list item."""
-        file_path = item.data(Qt.ItemDataRole.UserRole)
-        if file_path:
-            return Path(file_path)
-        return None
+        return item.data(Qt.ItemDataRole.UserRole)
     
     def select_all(self):
         """Check all items."""
-        for i in range(self.count()):
-            self.item(i).setCheckState(Qt.CheckState.Checked)
+        self._set_all_check_state(Qt.CheckState.Checked)
+        self._checked = set(self._rows)
     
     def deselect_all(self):
         """Uncheck all items."""
-        for i in range(self.count()):
-            self.item(i).setCheckState(Qt.CheckState.Unchecked)
\ No newline at end of file
+        self._set_all_check_state(Qt.CheckState.Unchecked)
+        self._checked.clear()
+    
+    def set_checked_rows(self, checked: List[bool]):
+        """Set each row's check state from a per-row flag list in one batch."""
+        self._apply_check_states(
+            Qt.CheckState.Checked if is_checked else Qt.CheckState.Unchecked
+            for is_checked in checked
+        )
+        self._checked = {path for path, row in self._rows.items() if checked[row]}
+    
+    def _set_all_check_state(self, state: Qt.CheckState):
+        """Set every item's check state without per-item itemChanged handling."""
+        self._apply_check_states(state for _ in range(self.count()))
+    
+    def _apply_check_states(self, states: Iterable[Qt.CheckState]):
+        """Set check states row by row, announcing them with one dataChanged.
+        
+        Model signals are held back during the loop so the view sees a single
+        ranged update instead of one per item.
+        """
+        count = self.count()
+        if not count:
+            return
+        model = self.model()
+        with self._bulk_update():
+            self.blockSignals(True)
+            model.blockSignals(True)
+            try:
+                for row, state in enumerate(states):
+                    self.item(row).setCheckState(state)
+            finally:
+                model.blockSignals(False)
+            try:
+                model.dataChanged.emit(
+                    model.index(0, 0), model.index(count - 1, 0),
+                    [Qt.ItemDataRole.CheckStateRole]
+                )
+            finally:
+                self.blockSignals(False)
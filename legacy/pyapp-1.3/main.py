@@ -4,13 +4,13 @@ Sprite Toolkit - Image Processing & Sprite Sheet Packer
 A professional desktop application for batch image processing and sprite sheet creation.
 """
 import sys
+import multiprocessing
+import traceback
 from pathlib import Path
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
-
-from gui.main_window import MainWindow
+from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtGui import QIcon, QPixmapCache
 
 # Application metadata
 APP_NAME = "Sprite Toolkit"
@@ -18,6 +18,9 @@ APP_VERSION = "1.0.0"
 ORG_NAME = "SpriteTools"
 ORG_DOMAIN = "spritetools.local"
 
+# qdarktheme stylesheet, generated on first use
+_dark_stylesheet = None
+
 
 def apply_dark_theme(app: QApplication) -> None:
     """
@@ -25,12 +28,16 @@ def apply_dark_theme(app: QApplication) -> None:
     Falls back to a Fusion dark palette if pyqtdarktheme isn't available.
     """
     try:
-        # NOTE: package is installed as 'pyqtdarktheme' but imported as 'qdarktheme'
-        import qdarktheme  # provided by pyqtdarktheme==0.1.x
+        global _dark_stylesheet
+        if _dark_stylesheet is None:
+            # NOTE: package is installed as 'pyqtdarktheme' but imported as 'qdarktheme'
+            import qdarktheme  # provided by pyqtdarktheme==0.1.x
+
+            # Old API: returns a QSS string; apply to the app.
+            _dark_stylesheet = qdarktheme.load_stylesheet("dark")
 
-        # Old API: returns a QSS string; apply to the app.
         app.setStyle("Fusion")
-        app.setStyleSheet(qdarktheme.load_stylesheet("dark"))
+        app.setStyleSheet(_dark_stylesheet)
     except Exception:
         # Fallback: Fusion dark palette
         from PySide6.QtGui import QPalette, QColor
@@ -74,13 +81,39 @@ def main():
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
 
-    # Create and show main window
-    window = MainWindow()
-    window.show()
+    # The GUI modules pull in NumPy, SciPy and Pillow; import them once the
+    # event loop is running rather than before anything can start
+    windows = []
+
+    def create_and_show():
+        try:
+            from gui.main_window import MainWindow
+            from gui.widgets.image_list_widget import PIXMAP_CACHE_LIMIT_KB, ThumbnailCachePruner
+
+            # Room for shared list thumbnails across tabs and reloads
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+            QThreadPool.globalInstance().start(ThumbnailCachePruner())
+
+            window = MainWindow()
+            window.show()
+            windows.append(window)
+        except Exception as e:
+            # Exceptions in timer callbacks don't stop the event loop, so quit explicitly
+            traceback.print_exc()
+            QMessageBox.critical(
+                None,
+                "Startup Error",
+                f"{APP_NAME} failed to start:\n\n{e}\n\n{traceback.format_exc()}"
+            )
+            app.exit(1)
+
+    QTimer.singleShot(0, create_and_show)
 
     # Run application
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # Required for the image process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()